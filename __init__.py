@@ -1,3 +1,8 @@
 from .interface import Indicator, Plotter
+from .chart.live import LiveChart
+from .chart.universe import UniverseChart, UniverseHeatmap
+from .chart.batch import export_charts
+from .chart.assets import set_assets
 from .get_data import DataSource
+from .utils.env import set_environment
 from .utils.const import _CRIMSON_RED, _EMERALD_GREEN, _TURKISH_SEA, _SLATE_BLUE, _ORANGE, _ISLAND_GREEN, _LIME_PUNCH, _GRADIENT_EMERALD, DARK_MODE_PRIMARY_COLORS, DARK_MODE_SECONDARY_COLORS, LIGHT_MODE_PRIMARY_COLORS, LIGHT_MODE_SECONDARY_COLORS
\ No newline at end of file
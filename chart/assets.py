@@ -0,0 +1,139 @@
+import os
+import re
+import glob
+import base64
+import shutil
+import functools
+import mimetypes
+from typing import Any, Optional
+
+ASSET_MODES = ['online', 'local', 'inline']
+
+# File name of the ECharts bundle, as pyecharts links it: <js_host>echarts.min.js.
+ECHARTS_BUNDLE = "echarts.min.js"
+
+_ECHARTS_LINK = re.compile(r'<script type="text/javascript" src="[^"]*' + re.escape(ECHARTS_BUNDLE) + r'"></script>')
+
+_ASSETS = {'mode': 'online', 'js_host': None, 'echarts_js': None, 'logo': None}
+
+# Whether the bundle was already inlined into the notebook page, see html().
+_INLINED = False
+
+
+def set_assets(mode: str = 'online', js_host: str = None, echarts_js: str = None, logo: str = None):
+    """
+    Choose where rendered charts load the ECharts library and the watermark logo from.
+
+    Args:
+        mode (str): 'online' loads them from the pyecharts CDN and vnstocks.com (default). 'local' links the bundle
+            from `js_host`, e.g. a directory filled with copy_echarts. 'inline' writes the bundle into the page itself:
+            once per notebook page, or once per standalone HTML file. Both offline modes work without network.
+        js_host (str): URL prefix serving echarts.min.js, required by the 'local' mode, e.g. '/assets/' or 'assets/'.
+        echarts_js (str): Path of the ECharts bundle. Default is None (the bundle shipped with Panel).
+        logo (str): Path of a local watermark image, embedded as a data URI by the offline modes.
+            Default is None (no watermark offline).
+    """
+    global _ASSETS, _INLINED
+    if mode not in ASSET_MODES:
+        raise ValueError(f"Unknown asset mode: {mode}. Valid modes are {ASSET_MODES}")
+    if mode == 'local' and not js_host:
+        raise ValueError("The 'local' asset mode needs the js_host serving echarts.min.js")
+    _ASSETS = {
+        'mode': mode,
+        'js_host': js_host if not js_host or js_host.endswith('/') else js_host + '/',
+        'echarts_js': echarts_js,
+        'logo': logo,
+    }
+    _INLINED = False
+
+
+def get_assets() -> dict:
+    """
+    Return the asset configuration declared with set_assets.
+    """
+    return dict(_ASSETS)
+
+
+def echarts_path() -> str:
+    """
+    Return the path of the ECharts bundle: the one given to set_assets, else the copy shipped with Panel.
+    """
+    if _ASSETS['echarts_js']:
+        return _ASSETS['echarts_js']
+    import panel
+    bundled = sorted(glob.glob(os.path.join(os.path.dirname(panel.__file__), 'dist', 'bundled', 'echarts', 'echarts@*', 'dist', ECHARTS_BUNDLE)))
+    if not bundled:
+        raise FileNotFoundError(f"No local {ECHARTS_BUNDLE} found, pass its path to set_assets(echarts_js=...)")
+    return bundled[-1]
+
+
+def copy_echarts(directory: str) -> str:
+    """
+    Copy the ECharts bundle into `directory`, to be served as the js_host of the 'local' mode.
+
+    Returns:
+        str: Path of the copied bundle.
+    """
+    os.makedirs(directory, exist_ok=True)
+    return shutil.copyfile(echarts_path(), os.path.join(directory, ECHARTS_BUNDLE))
+
+
+@functools.lru_cache(maxsize=None)
+def _read_text(path: str) -> str:
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=None)
+def data_uri(path: str) -> str:
+    """
+    Encode a local image as a data URI.
+    """
+    mime_type = mimetypes.guess_type(path)[0] or 'image/png'
+    with open(path, 'rb') as f:
+        return f"data:{mime_type};base64,{base64.b64encode(f.read()).decode()}"
+
+
+def logo_source(online_url: str) -> Optional[str]:
+    """
+    Return the watermark image to use: `online_url` online, the local logo as a data URI offline, or None
+    when no local logo was given (the watermark is left out rather than shown broken).
+    """
+    if _ASSETS['mode'] == 'online':
+        return online_url
+    return data_uri(_ASSETS['logo']) if _ASSETS['logo'] else None
+
+
+def prepare(chart: Any) -> Any:
+    """
+    Point the chart at the local js_host in the 'local' mode. Other modes leave it unchanged.
+    """
+    if _ASSETS['mode'] == 'local':
+        chart.js_host = _ASSETS['js_host']
+    return chart
+
+
+def html(chart: Any, shared_page: bool = False) -> str:
+    """
+    Render a chart to HTML with the configured assets.
+
+    Args:
+        chart: A pyecharts chart or Grid.
+        shared_page (bool): The HTML is displayed in a page that keeps earlier outputs (a notebook). The 'inline'
+            mode then writes the bundle into the first output only and later outputs reuse it. Default is False
+            (a standalone page, which always gets the bundle).
+
+    Returns:
+        str: The HTML of the chart.
+    """
+    global _INLINED
+    page = prepare(chart).render_embed()
+    if _ASSETS['mode'] != 'inline':
+        return page
+    if shared_page and _INLINED:
+        script = ''
+    else:
+        # Hiding `define` keeps the bundle global where require.js is loaded (classic notebook), so echarts.init works.
+        script = f'<script type="text/javascript">(function (define) {{\n{_read_text(echarts_path())}\n}}).call(window);</script>'
+        _INLINED = _INLINED or shared_page
+    return _ECHARTS_LINK.sub(lambda match: script, page, count=1)
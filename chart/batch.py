@@ -0,0 +1,105 @@
+import os
+import time
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Sequence, Tuple, Union
+from vnstock_ta.chart import assets, spec
+from vnstock_ta.chart.live import IndicatorSpec, _parse_indicator
+from vnstock_ta.utils.env import set_environment
+
+EXPORT_FORMATS = ['html', 'json']
+
+
+def export_charts(sources: Union[Dict[str, pd.DataFrame], Sequence[str]], charts: List[IndicatorSpec], output_dir: str,
+                  formats: Sequence[str] = ('html',), theme: str = 'light', max_workers: int = None,
+                  start: str = '2024-01-02', end: str = '2024-06-10', interval: str = '1D', source: str = 'VCI') -> pd.DataFrame:
+    """
+    Render the same set of charts for many symbols in parallel worker processes and write one file per symbol and chart.
+
+    Workers render in memory with the environment declared as 'Other' (no notebook detection, no shared
+    or temporary output file), so any number of them can run at once. They use the assets configured with set_assets.
+
+    Args:
+        sources (Union[Dict[str, pd.DataFrame], Sequence[str]]): OHLCV data per symbol, or symbols to load with DataSource.
+        charts (List[IndicatorSpec]): Charts to render: 'base' (candlestick and volume), 'minimal' (price line and volume) or
+            a Plotter method name, optionally with its parameters, e.g. ['base', 'rsi', ('sma', {'length': [20, 50]})].
+        output_dir (str): Directory of the files, named <symbol>_<chart>.<format>.
+        formats (Sequence[str]): 'html' (standalone page) and/or 'json' (compact ECharts option). Default is ('html',).
+        theme (str): 'light' or 'dark'. Default is 'light'.
+        max_workers (int): Number of worker processes. Default is None (number of CPUs).
+        start (str): Start date when loading symbols. Default is '2024-01-02'.
+        end (str): End date when loading symbols. Default is '2024-06-10'.
+        interval (str): Bar interval when loading symbols. Default is '1D'.
+        source (str): Data source when loading symbols. Default is 'VCI'.
+
+    Returns:
+        pd.DataFrame: One row per symbol with the load, render and write times in seconds, the number of files
+            written and the error message of symbols that failed.
+    """
+    unknown = [fmt for fmt in formats if fmt not in EXPORT_FORMATS]
+    if unknown:
+        raise ValueError(f"Unknown formats: {unknown}. Valid formats are {EXPORT_FORMATS}")
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = sources.items() if isinstance(sources, dict) else ((symbol, None) for symbol in sources)
+    loader = {'start': start, 'end': end, 'interval': interval, 'source': source}
+
+    reports = []
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(assets.get_assets(),)) as executor:
+        futures = [executor.submit(_export_symbol, symbol, data, charts, output_dir, list(formats), theme, loader) for symbol, data in jobs]
+        for future in as_completed(futures):
+            reports.append(future.result())
+    return pd.DataFrame(reports).set_index('symbol')
+
+
+def _init_worker(asset_config: Dict[str, str]):
+    set_environment("Other")
+    assets.set_assets(**asset_config)
+
+
+def _export_symbol(symbol: str, data: pd.DataFrame, charts: List[IndicatorSpec], output_dir: str, formats: List[str],
+                   theme: str, loader: Dict[str, str]) -> Dict[str, Any]:
+    report = {'symbol': symbol, 'load': 0.0, 'render': 0.0, 'write': 0.0, 'files': 0, 'error': None}
+    try:
+        started = time.perf_counter()
+        if data is None:
+            from vnstock_ta.get_data import DataSource
+            data = DataSource(symbol=symbol, **loader).data
+        report['load'] = time.perf_counter() - started
+
+        from vnstock_ta.interface import Plotter
+        plotter = Plotter(data, theme=theme, display=False)
+        for label, chart in _chart_labels(charts):
+            started = time.perf_counter()
+            name, params = chart
+            if name == 'base':
+                grid_chart = plotter._context.chart.base_trading_chart(title=symbol, display=False, **params)
+            elif name == 'minimal':
+                grid_chart = plotter._context.chart.minimal_trading_chart(title=symbol, display=False, **params)
+            else:
+                grid_chart = getattr(plotter, name)(**params)
+            contents = {fmt: assets.html(grid_chart) if fmt == 'html' else spec.dumps(spec.chart_spec(grid_chart)) for fmt in formats}
+            report['render'] += time.perf_counter() - started
+
+            started = time.perf_counter()
+            for fmt, content in contents.items():
+                with open(os.path.join(output_dir, f"{symbol}_{label}.{fmt}"), 'w', encoding='utf-8') as f:
+                    f.write(content)
+                report['files'] += 1
+            report['write'] += time.perf_counter() - started
+    except Exception as e:
+        report['error'] = f"{type(e).__name__}: {e}"
+    return report
+
+
+def _chart_labels(charts: List[IndicatorSpec]) -> List[Tuple[str, Tuple[str, Dict[str, Any]]]]:
+    """
+    File label of each chart: its name, followed by its parameter values, e.g. sma_20_50 for ('sma', {'length': [20, 50]}).
+    """
+    labelled = []
+    for chart in charts:
+        name, params = _parse_indicator(chart)
+        values = []
+        for value in params.values():
+            values.extend(value if isinstance(value, (list, tuple)) else [value])
+        labelled.append(('_'.join([name, *map(str, values)]), (name, params)))
+    return labelled
@@ -1,13 +1,19 @@
+import os
+import tempfile
+import functools
 import pandas as pd
 import numpy as np
 import panel as pn
-from typing import List, Dict, Any, Union, Tuple
+from typing import List, Dict, Any, Union, Tuple, Callable
 from pyecharts import options as opts
 from pyecharts.charts import Kline, Line, Bar, Scatter, Boxplot, HeatMap, Grid, Page
 from pyecharts.globals import ThemeType
 from pyecharts.commons.utils import JsCode
 from vnstock_ta.get_data import DataSource
-from vnstock_ta.utils.env import SystemInfo
+from vnstock_ta.utils.env import detect_environment
+from vnstock_ta.indicators.base import data_version
+from vnstock_ta.chart import assets, downsample, spec
+from vnstock_ta.chart.pyramid import BarPyramid
 from vnstock_ta.utils.const import _EMERALD_GREEN, _CRIMSON_RED, _SLATE_BLUE, _GRADIENT_EMERALD
 
 try:
@@ -16,8 +22,247 @@ try:
 except ImportError:
     IS_NOTEBOOK = False
 
+# Number of bars above which charts switch to the large-data profile.
+LARGE_DATA_THRESHOLD = 20000
+
+# ECharts series options of the large-data profile, per series type: batched drawing ('large'),
+# chunked rendering across frames ('progressive') and pixel-level downsampling ('sampling').
+LARGE_SERIES_OPTS = {
+    'candlestick': {'large': True, 'largeThreshold': 2000, 'progressive': 5000, 'progressiveThreshold': 10000, 'animation': False},
+    'bar': {'large': True, 'largeThreshold': 2000, 'progressive': 5000, 'progressiveThreshold': 10000, 'sampling': 'max', 'animation': False},
+    'scatter': {'large': True, 'largeThreshold': 2000, 'progressive': 5000, 'progressiveThreshold': 10000, 'animation': False},
+    'line': {'sampling': 'lttb', 'showSymbol': False, 'animation': False},
+    'heatmap': {'progressive': 5000, 'progressiveThreshold': 10000, 'animation': False},
+}
+
+# Signed histogram bar colors: positive and rising, positive and falling, negative and falling, negative and rising.
+HISTOGRAM_COLORS = ("#3CB371", "#90EE90", "#FF6347", "#FFB6C1")
+
+def signed_histogram_colors(values: Any, colors: Tuple[str, str, str, str] = HISTOGRAM_COLORS, neutral: str = "#000000") -> np.ndarray:
+    """
+    Classify the bars of a signed histogram (e.g. MACD) by sign and direction against the previous bar in one vectorized pass.
+
+    Args:
+        values: Histogram values. The bar before the first one counts as 0.
+        colors (Tuple[str, str, str, str]): Colors for positive rising, positive falling, negative falling and negative rising bars.
+        neutral (str): Color of zero and NaN bars.
+
+    Returns:
+        np.ndarray: One color per bar.
+    """
+    values = np.asarray(values, dtype=float)
+    previous = np.concatenate([[0.0], values[:-1]])
+    conditions = [
+        (values > 0) & (values >= previous),
+        (values > 0) & (values < previous),
+        (values < 0) & (values <= previous),
+        (values < 0) & (values > previous),
+    ]
+    return np.select(conditions, colors, default=neutral)
+
+# Chart colors per theme and color category. Read-only: every chart looks its palette up here.
+COLOR_PALETTES = {
+    'DARK': {
+        'neutral': {
+            'bull_color': _EMERALD_GREEN,
+            'bear_color': _CRIMSON_RED,
+            'bg_color': '#0E1114',
+            'mono_color': _EMERALD_GREEN,
+            'text_color': "#fff",
+            'indicator_color': "#30A2DA",
+            'indicator_1_color': "#37745B",
+            'indicator_2_color': "#FC4F30",
+            'indicator_3_color': "#E5AE38",
+            'indicator_4_color': "#DA6A00",
+            'indicator_5_color': "#6A7793"
+        },
+        'positive': {
+            'bull_color': "#2BAE66FF",
+            'bear_color': "#EEA47FFF",
+            'bg_color': '#0E1114',
+            'mono_color': '#2BAE66FF',  # ISLAND GREEN
+            'text_color': "#fff",
+            'indicator_color': "#89ABE3FF",
+            'indicator_1_color': "#00539CFF",
+            'indicator_2_color': "#0063B2FF",
+            'indicator_3_color': "#FEE715FF",
+            'indicator_4_color': "#ADEFD1FF",
+            'indicator_5_color': "#D7A9E3FF"
+        },
+        'negative': {
+            'bull_color': "#2C5F2D",
+            'bear_color': "#F65058FF",
+            'bg_color': '#101820FF',
+            'mono_color': '#2C5F2D',  # FOREST GREEN
+            'text_color': "#fff",
+            'indicator_color': "#00539CFF",
+            'indicator_1_color': "#949398FF",
+            'indicator_2_color': "#A2A2A1FF",
+            'indicator_3_color': "#606060FF",
+            'indicator_4_color': "#28334AFF",
+            'indicator_5_color': "#006B38FF"
+        },
+        'colorful': {
+            'bull_color': "#6D904F",
+            'bear_color': "#FC4F30",
+            'bg_color': '#0E1114',
+            'mono_color': '#6D904F',  # VITAL GREEN
+            'text_color': "#fff",
+            'indicator_color': "#30A2DA",
+            'indicator_1_color': "#37745B",
+            'indicator_2_color': "#FC4F30",
+            'indicator_3_color': "#E5AE38",
+            'indicator_4_color': "#DA6A00",
+            'indicator_5_color': "#6A7793"
+        }
+    },
+    'LIGHT': {
+        'neutral': {
+            'bull_color': _EMERALD_GREEN,
+            'bear_color': _CRIMSON_RED,
+            'bg_color': "#F9F7FA",
+            'mono_color': _EMERALD_GREEN,
+            'text_color': "#000000",
+            'indicator_color': "#30A2DA",
+            'indicator_1_color': "#37745B",
+            'indicator_2_color': "#FC4F30",
+            'indicator_3_color': "#E5AE38",
+            'indicator_4_color': "#DA6A00",
+            'indicator_5_color': "#6A7793"
+        },
+        'positive': {
+            'bull_color': "#2BAE66FF",
+            'bear_color': "#EEA47FFF",
+            'bg_color': "#F9F7FA",
+            'mono_color': '#2BAE66FF',  # ISLAND GREEN
+            'text_color': "#000000",
+            'indicator_color': "#89ABE3FF",
+            'indicator_1_color': "#00539CFF",
+            'indicator_2_color': "#0063B2FF",
+            'indicator_3_color': "#FEE715FF",
+            'indicator_4_color': "#ADEFD1FF",
+            'indicator_5_color': "#D7A9E3FF"
+        },
+        'negative': {
+            'bull_color': "#2C5F2D",
+            'bear_color': "#F65058FF",
+            'bg_color': "#FCF6F5FF",
+            'mono_color': '#2C5F2D',  # FOREST GREEN
+            'text_color': "#000000",
+            'indicator_color': "#00539CFF",
+            'indicator_1_color': "#949398FF",
+            'indicator_2_color': "#A2A2A1FF",
+            'indicator_3_color': "#606060FF",
+            'indicator_4_color': "#28334AFF",
+            'indicator_5_color': "#006B38FF"
+        },
+        'colorful': {
+            'bull_color': "#6D904F",
+            'bear_color': "#FC4F30",
+            'bg_color': "#F9F7FA",
+            'mono_color': '#6D904F',  # VITAL GREEN
+            'text_color': "#000000",
+            'indicator_color': "#30A2DA",
+            'indicator_1_color': "#37745B",
+            'indicator_2_color': "#FC4F30",
+            'indicator_3_color': "#E5AE38",
+            'indicator_4_color': "#DA6A00",
+            'indicator_5_color': "#6A7793"
+        }
+    }
+}
+
+@functools.lru_cache(maxsize=None)
+def _load_echarts_extension():
+    pn.extension('echarts')
+
+@functools.lru_cache(maxsize=None)
+def _global_opts_template(theme: str, color_category: str, zoomable: bool, zoom_slider: bool, legend: bool, tools: bool) -> Dict[str, Any]:
+    """
+    Tooltip, axis pointer, legend, toolbox, brush and data zoom options of a theme, color category and set of flags.
+    Built once and shared by every chart: the option objects are read-only, callers copy the dict.
+    """
+    palette = COLOR_PALETTES[theme][color_category]
+    global_opts = {
+        "tooltip_opts": opts.TooltipOpts(
+            trigger="axis",
+            axis_pointer_type="cross",
+            background_color=palette['bg_color'],
+            border_width=1,
+            border_color="#ccc",
+            textstyle_opts=opts.TextStyleOpts(color=palette['text_color']),
+        ),
+        "axispointer_opts": opts.AxisPointerOpts(
+            is_show=True,
+            link=[{"xAxisIndex": "all"}],
+            label=opts.LabelOpts(background_color="#777"),
+        ),
+    }
+
+    if tools:
+        global_opts["toolbox_opts"] = opts.ToolboxOpts(
+            is_show=True,
+            orient="vertical",
+            pos_left="right",
+            feature=opts.ToolBoxFeatureOpts(
+                save_as_image={"show": True, "title": "Save as Image", "type_": "png", "pixel_ratio": 1},
+                restore={"show": True, "title": "Restore"},
+                data_view={"show": True, "title": "Data View"},
+                data_zoom={"show": True, "title": "Data Zoom"},
+                magic_type={"show": True, "title": "Magic Type", "type": ["line", "bar", "stack", "tiled"], "option": {"seriesIndex": "all"}, "line_title": "Line Chart", "bar_title": "Bar Chart", "stack_title": "Stack Chart", "tiled_title": "Tiled Chart"},
+            ),
+        )
+        global_opts["brush_opts"] = opts.BrushOpts(
+            tool_box=["rect", "polygon", "lineX", "lineY", "keep", "clear"],
+            x_axis_index="all",
+            brush_link="all",
+            out_of_brush={"colorAlpha": 0.1},
+            brush_type="lineX",
+        )
+
+    if zoomable:
+        global_opts["datazoom_opts"] = (
+            opts.DataZoomOpts(
+                is_show=zoom_slider,
+                type_="slider",
+                xaxis_index=[0, 1, 2],
+                range_start=0,
+                range_end=100,
+            ),
+            opts.DataZoomOpts(
+                is_show=True,
+                type_="inside",
+                xaxis_index=[0, 1, 2],
+                range_start=0,
+                range_end=100,
+            ),
+        )
+
+    global_opts["legend_opts"] = opts.LegendOpts(is_show=legend)
+    return global_opts
+
+@functools.lru_cache(maxsize=None)
+def _watermark_template(logo_path: str, top: float, width: int, height: int, opacity: float) -> Tuple[opts.GraphicImage, ...]:
+    """
+    Watermark logo of a theme and chart size. Built once and shared by every chart: the option objects are read-only.
+    """
+    return (
+        opts.GraphicImage(
+            graphic_item=opts.GraphicItem(
+                id_="logo", left=50, top=top, z=-10, bounding="raw", origin=[75, 75]
+            ),
+            graphic_imagestyle_opts=opts.GraphicImageStyleOpts(
+                image=logo_path,
+                width=width,
+                height=height,
+                opacity=opacity,
+            ),
+        ),
+    )
+
 class BaseChart:
-    def __init__(self, candle_data: pd.DataFrame, theme: str = "dark", color_category: str = 'neutral', width: str = "1500px", height: str = "900px"):
+    def __init__(self, candle_data: pd.DataFrame, theme: str = "dark", color_category: str = 'neutral', width: str = "1500px", height: str = "900px",
+                 max_points: int = None, large_threshold: int = LARGE_DATA_THRESHOLD, shared_dataset: bool = False):
         """
         Initialize the chart with candle data, theme, and color category.
 
@@ -25,13 +270,24 @@ class BaseChart:
             candle_data (pd.DataFrame): Candlestick data containing open, high, low, close, and volume.
             theme (str): Theme of the chart. Options are 'dark' or 'light'.
             color_category (str): Color category for the chart. Options are 'positive', 'negative', 'neutral', 'colorful'.
+            max_points (int): Maximum number of points sent to the browser per series. Longer data is downsampled:
+                candles are aggregated (OHLC), volume is summed and lines keep their shape with LTTB. Default is None (all points).
+            large_threshold (int): Number of bars above which the ECharts large-data profile is used: batched and progressive
+                rendering, sampling and no animation. Default is LARGE_DATA_THRESHOLD.
+            shared_dataset (bool): Emit the series data as one shared ECharts dataset instead of one copy per series and
+                sub-chart. Default is False.
         """
         self.theme = theme.upper()
         self.color_category = color_category
         self.width = width
         self.height = height
+        self.max_points = max_points
+        self.large_threshold = large_threshold
+        self.shared_dataset = shared_dataset
         self.is_notebook = IS_NOTEBOOK
         self.data = candle_data
+        self._prepared_version = None
+        self._prepared_series = {}
         self._validate_inputs()
         self._ui_config()
         self._config(theme=self.theme, color_category=color_category)
@@ -48,171 +304,81 @@ class BaseChart:
 
     def _ui_config(self):
         """
-        Detect the UI configuration for the current machine.
+        Detect the UI configuration for the current machine. Detection runs once per process,
+        see utils.env.set_environment to declare it explicitly.
         """
-        system_info = SystemInfo()
-        self.interface = system_info.interface()
-        self.hosting = system_info.hosting()
-        self.os = system_info.os()
+        environment = detect_environment()
+        self.interface = environment['interface']
+        self.hosting = environment['hosting']
+        self.os = environment['os']
 
         # Additional imports for Google Colab
         if self.hosting == "Google Colab":
-            pn.extension('echarts')
+            _load_echarts_extension()
 
     def _render(self, chart: Any, display: bool = True) -> Union[pn.pane.ECharts]:
         """
         Configure the preference for chart rendering.
 
+        Notebooks and display='html' render in memory, which is what servers should use. Other interfaces get
+        an HTML file with a unique temporary name, never a shared file in the working directory, so several
+        threads or kernels can render at the same time. The caller owns that file and deletes it when done.
+        The ECharts library is loaded from the CDN, a local host or inlined, see chart.assets.set_assets.
+
         Args:
             chart: The chart object.
-            display (bool): Render the chart directly or just return the raw chart object for further manipulation.
+            display (Union[bool, str]): Render the chart directly, return the raw chart object for further manipulation (False),
+                the standalone HTML page as a string ('html') or the compact ECharts option as JSON ('json', see chart.spec).
 
         Returns:
-            Rendered chart or raw chart object.
+            Rendered chart, the HTML string, the option JSON, the path of the HTML file (outside notebooks) or raw chart object.
         """
+        if display == 'json':
+            return spec.dumps(spec.chart_spec(chart, dataset=self.shared_dataset))
+        if display == 'html':
+            return assets.html(chart)
         if display:
             if self.hosting == "Google Colab":
                 # try:
                 #     return pn.pane.ECharts(chart)
                 # except:
-                return self._show_html(chart.render('chart.html'))
+                # Colab shows each output in its own frame, which needs its own copy of inlined assets.
+                return self._show_html(assets.html(chart))
             elif self.hosting == "Jupyterlab":
-                return self._show_html(chart.render('chart.html'))
+                return self._show_html(assets.html(chart, shared_page=True))
             if self.interface == "Jupyter":
-                return chart.render_notebook()
+                if assets.get_assets()['mode'] == 'inline':
+                    return self._show_html(assets.html(chart, shared_page=True))
+                return assets.prepare(chart).render_notebook()
             else:
-                return chart.render()
+                return self._render_file(chart)
         else:
             return chart
 
-    def _show_html(self, filename: str):
+    def _render_file(self, chart: Any) -> str:
+        """
+        Render the chart to a new temporary HTML file and return its path. The file is left for the caller to delete.
         """
-        Display the saved HTML file in Google Colab.
+        fd, path = tempfile.mkstemp(prefix='vnstock_ta_', suffix='.html')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(assets.html(chart))
+        return path
+
+    def _show_html(self, html: str):
+        """
+        Display the rendered HTML in a notebook (e.g. Google Colab).
 
         Args:
-            filename (str): The path to the HTML file.
+            html (str): The HTML content of the chart.
         """
         if self.is_notebook == True:
-            with open(filename, 'r') as f:
-                html_content = f.read()
-            display(HTML(html_content))
+            display(HTML(html))
 
     def _apply_color_palette(self, theme: str, color_category: str = 'neutral'):
         """
-        Apply the color palette based on the theme and color category.
-        """
-        color_palettes = {
-            'DARK': {
-                'neutral': {
-                    'bull_color': _EMERALD_GREEN,
-                    'bear_color': _CRIMSON_RED,
-                    'bg_color': '#0E1114',
-                    'mono_color': _EMERALD_GREEN,
-                    'text_color': "#fff",
-                    'indicator_color': "#30A2DA",
-                    'indicator_1_color': "#37745B",
-                    'indicator_2_color': "#FC4F30",
-                    'indicator_3_color': "#E5AE38",
-                    'indicator_4_color': "#DA6A00",
-                    'indicator_5_color': "#6A7793"
-                },
-                'positive': {
-                    'bull_color': "#2BAE66FF",
-                    'bear_color': "#EEA47FFF",
-                    'bg_color': '#0E1114',
-                    'mono_color': '#2BAE66FF',  # ISLAND GREEN
-                    'text_color': "#fff",
-                    'indicator_color': "#89ABE3FF",
-                    'indicator_1_color': "#00539CFF",
-                    'indicator_2_color': "#0063B2FF",
-                    'indicator_3_color': "#FEE715FF",
-                    'indicator_4_color': "#ADEFD1FF",
-                    'indicator_5_color': "#D7A9E3FF"
-                },
-                'negative': {
-                    'bull_color': "#2C5F2D",
-                    'bear_color': "#F65058FF",
-                    'bg_color': '#101820FF',
-                    'mono_color': '#2C5F2D',  # FOREST GREEN
-                    'text_color': "#fff",
-                    'indicator_color': "#00539CFF",
-                    'indicator_1_color': "#949398FF",
-                    'indicator_2_color': "#A2A2A1FF",
-                    'indicator_3_color': "#606060FF",
-                    'indicator_4_color': "#28334AFF",
-                    'indicator_5_color': "#006B38FF"
-                },
-                'colorful': {
-                    'bull_color': "#6D904F",
-                    'bear_color': "#FC4F30",
-                    'bg_color': '#0E1114',
-                    'mono_color': '#6D904F',  # VITAL GREEN
-                    'text_color': "#fff",
-                    'indicator_color': "#30A2DA",
-                    'indicator_1_color': "#37745B",
-                    'indicator_2_color': "#FC4F30",
-                    'indicator_3_color': "#E5AE38",
-                    'indicator_4_color': "#DA6A00",
-                    'indicator_5_color': "#6A7793"
-                }
-            },
-            'LIGHT': {
-                'neutral': {
-                    'bull_color': _EMERALD_GREEN,
-                    'bear_color': _CRIMSON_RED,
-                    'bg_color': "#F9F7FA",
-                    'mono_color': _EMERALD_GREEN,
-                    'text_color': "#000000",
-                    'indicator_color': "#30A2DA",
-                    'indicator_1_color': "#37745B",
-                    'indicator_2_color': "#FC4F30",
-                    'indicator_3_color': "#E5AE38",
-                    'indicator_4_color': "#DA6A00",
-                    'indicator_5_color': "#6A7793"
-                },
-                'positive': {
-                    'bull_color': "#2BAE66FF",
-                    'bear_color': "#EEA47FFF",
-                    'bg_color': "#F9F7FA",
-                    'mono_color': '#2BAE66FF',  # ISLAND GREEN
-                    'text_color': "#000000",
-                    'indicator_color': "#89ABE3FF",
-                    'indicator_1_color': "#00539CFF",
-                    'indicator_2_color': "#0063B2FF",
-                    'indicator_3_color': "#FEE715FF",
-                    'indicator_4_color': "#ADEFD1FF",
-                    'indicator_5_color': "#D7A9E3FF"
-                },
-                'negative': {
-                    'bull_color': "#2C5F2D",
-                    'bear_color': "#F65058FF",
-                    'bg_color': "#FCF6F5FF",
-                    'mono_color': '#2C5F2D',  # FOREST GREEN
-                    'text_color': "#000000",
-                    'indicator_color': "#00539CFF",
-                    'indicator_1_color': "#949398FF",
-                    'indicator_2_color': "#A2A2A1FF",
-                    'indicator_3_color': "#606060FF",
-                    'indicator_4_color': "#28334AFF",
-                    'indicator_5_color': "#006B38FF"
-                },
-                'colorful': {
-                    'bull_color': "#6D904F",
-                    'bear_color': "#FC4F30",
-                    'bg_color': "#F9F7FA",
-                    'mono_color': '#6D904F',  # VITAL GREEN
-                    'text_color': "#000000",
-                    'indicator_color': "#30A2DA",
-                    'indicator_1_color': "#37745B",
-                    'indicator_2_color': "#FC4F30",
-                    'indicator_3_color': "#E5AE38",
-                    'indicator_4_color': "#DA6A00",
-                    'indicator_5_color': "#6A7793"
-                }
-            }
-        }
-
-        palette = color_palettes[theme][color_category]
+        Apply the color palette based on the theme and color category. Palettes are shared, see COLOR_PALETTES.
+        """
+        palette = COLOR_PALETTES[theme][color_category]
         self.bull_color = palette['bull_color']
         self.bear_color = palette['bear_color']
         self.bg_color = palette['bg_color']
@@ -241,61 +407,11 @@ class BaseChart:
             Dict[str, Any]: Common global options.
         """
 
-        global_opts = {
-            "tooltip_opts": opts.TooltipOpts(
-                trigger="axis",
-                axis_pointer_type="cross",
-                background_color=self.bg_color,
-                border_width=1,
-                border_color="#ccc",
-                textstyle_opts=opts.TextStyleOpts(color=self.text_color),
-            ),
-            "axispointer_opts": opts.AxisPointerOpts(
-                is_show=True,
-                link=[{"xAxisIndex": "all"}],
-                label=opts.LabelOpts(background_color="#777"),
-            ),
-            "graphic_opts": self._watermark(show=watermark)
-        }
-
-        if tools:
-            global_opts["toolbox_opts"] = opts.ToolboxOpts(
-                is_show=True,
-                orient="vertical",
-                pos_left="right",
-                feature=opts.ToolBoxFeatureOpts(
-                    save_as_image={"show": True, "title": "Save as Image", "type_": "png", "pixel_ratio": 1},
-                    restore={"show": True, "title": "Restore"},
-                    data_view={"show": True, "title": "Data View"},
-                    data_zoom={"show": True, "title": "Data Zoom"},
-                    magic_type={"show": True, "title": "Magic Type", "type": ["line", "bar", "stack", "tiled"], "option": {"seriesIndex": "all"}, "line_title": "Line Chart", "bar_title": "Bar Chart", "stack_title": "Stack Chart", "tiled_title": "Tiled Chart"},
-                ),
-            )
-            global_opts["brush_opts"] = opts.BrushOpts(
-                tool_box=["rect", "polygon", "lineX", "lineY", "keep", "clear"],
-                x_axis_index="all",
-                brush_link="all",
-                out_of_brush={"colorAlpha": 0.1},
-                brush_type="lineX",
-            )
-
+        global_opts = dict(_global_opts_template(self.theme, self.color_category, zoomable, zoom_slider, legend, tools))
         if zoomable:
-            global_opts["datazoom_opts"] = [
-                opts.DataZoomOpts(
-                    is_show=zoom_slider,
-                    type_="slider",
-                    xaxis_index=[0, 1, 2],
-                    range_start=0,
-                    range_end=100,
-                ),
-                opts.DataZoomOpts(
-                    is_show=True,
-                    type_="inside",
-                    xaxis_index=[0, 1, 2],
-                    range_start=0,
-                    range_end=100,
-                ),
-            ]
+            # Grid extends the dataZoom list of the charts it combines, so each chart gets its own list.
+            global_opts["datazoom_opts"] = list(global_opts["datazoom_opts"])
+        global_opts["graphic_opts"] = self._watermark(show=watermark)
 
         if subplot:
             global_opts["title_opts"] = opts.TitleOpts(
@@ -312,11 +428,6 @@ class BaseChart:
                 title_textstyle_opts=opts.TextStyleOpts(font_family=self.font_family, font_size=self.font_size * 1.5, color=self.text_color)
             )
 
-        if legend:
-            global_opts["legend_opts"] = opts.LegendOpts(is_show=True)
-        else:
-            global_opts["legend_opts"] = opts.LegendOpts(is_show=False)
-
         return global_opts
 
     def _config(self, theme: str = 'dark', color_category: str = 'neutral', width: str = "1500px", height: str = "900px"):
@@ -360,6 +471,8 @@ class BaseChart:
             self.logo_path = "https://vnstocks.com/img/vnstock_logo_trans_rec_hoz_bw.png"
         elif theme == 'LIGHT':
             self.logo_path = "https://vnstocks.com/img/vnstock_logo_trans_rec_hoz.png"
+        # Offline, the logo comes from a local file or is left out, see chart.assets.set_assets.
+        self.logo_path = assets.logo_source(self.logo_path)
 
     def _watermark(self, show: bool = True) -> List[opts.GraphicImage]:
         """
@@ -371,23 +484,41 @@ class BaseChart:
         Returns:
             List[opts.GraphicImage]: Watermark configuration.
         """
-        if show:
-            watermark = [
-                opts.GraphicImage(
-                    graphic_item=opts.GraphicItem(
-                        id_="logo", left=50, top=self.logo_top_pos, z=-10, bounding="raw", origin=[75, 75]
-                    ),
-                    graphic_imagestyle_opts=opts.GraphicImageStyleOpts(
-                        image=self.logo_path,
-                        width=self.logo_width,
-                        height=self.logo_height,
-                        opacity=self.logo_opacity,
-                    ),
-                )
-            ]
-        else:
-            watermark = []
-        return watermark
+        if show and self.logo_path:
+            return list(_watermark_template(self.logo_path, self.logo_top_pos, self.logo_width, self.logo_height, self.logo_opacity))
+        return []
+
+    def _is_large(self, n_points: int = None) -> bool:
+        """
+        Whether a chart of `n_points` bars (default: the chart data as sent to the browser) needs the large-data profile.
+        """
+        if n_points is None:
+            n_points = len(self._time_index())
+        return self.large_threshold is not None and n_points > self.large_threshold
+
+    def _large_data_profile(self, chart: Any, n_points: int) -> Any:
+        """
+        Switch the series of a chart layer to the large-data profile when it has more than `large_threshold` bars.
+
+        Batched drawing ('large') ignores per-item styles, so it is left off for series that carry them
+        (e.g. volume bars colored by candle direction), which still get progressive rendering.
+
+        Args:
+            chart: The chart layer.
+            n_points (int): Number of bars of the layer.
+
+        Returns:
+            The same chart layer.
+        """
+        if not self._is_large(n_points):
+            return chart
+        for series in chart.options.get('series', []):
+            profile = dict(LARGE_SERIES_OPTS.get(series.get('type'), {}))
+            data = series.get('data') or []
+            if data and isinstance(data[0], dict):
+                profile.pop('large', None)
+            series.update(profile)
+        return chart
 
     def _volume(self, time_series: List[str], data_series: List[Union[Dict[str, Any], float]], title: str = "Volume", yaxis_name: str = 'Volume', subplot=True,
                 compatibility: bool = False, color: str = _SLATE_BLUE, label: bool = False,
@@ -470,7 +601,7 @@ class BaseChart:
         # remove title_opts from common_opts
         common_opts.pop("title_opts", None)
         volume_bar.set_global_opts(**{**specific_opts, **common_opts})
-        return volume_bar
+        return self._large_data_profile(volume_bar, len(time_series))
 
     def _kline(self, time_series: List[str], ohlc_data: List[List[float]], title: str = 'Candlestick Chart', yaxis_name: str = 'Price', right_y:bool=True, show_xaxis: bool = False,
                tools: bool = True, watermark: bool = False) -> Kline:
@@ -555,7 +686,7 @@ class BaseChart:
         common_opts = self._common_global_opts(title=title, zoomable=True, zoom_slider=True, subplot=False, legend=False, tools=tools, watermark=watermark)
         
         kline.set_global_opts(**{**specific_opts, **common_opts})
-        return kline
+        return self._large_data_profile(kline, len(time_series))
 
     def _line(self, time_series: List[str], data_series: List[float], mark_points_data: List[opts.MarkPointItem] = None,
               title: str = "Line Chart", yaxis_name:str='Price', right_y: bool = True, 
@@ -637,7 +768,7 @@ class BaseChart:
         line_chart = (
             Line(init_opts=opts.InitOpts(theme=theme_opts, bg_color=self.bg_color))
             .add_xaxis(time_series)
-            .add_yaxis(series_name=yaxis_name, y_axis=data_series, 
+            .add_yaxis(series_name=yaxis_name, y_axis=self._downsample(data_series), 
                        is_step=is_step,
                        is_smooth=is_smooth, 
                        is_symbol_show=label,
@@ -677,7 +808,7 @@ class BaseChart:
         common_opts = self._common_global_opts(title=title, zoomable=zoomable, zoom_slider=zoom_slider, subplot=subplot, legend=legend, tools=tools, watermark=watermark)
 
         line_chart.set_global_opts(**{**specific_opts, **common_opts})
-        return line_chart
+        return self._large_data_profile(line_chart, len(time_series))
 
     def _base_line(self, time_series: List[str], data_series: List[float], title: str = 'Base Line', 
                    yaxis_name: str = 'Price', right_y: bool = True,
@@ -744,7 +875,7 @@ class BaseChart:
         baseline_chart = Line(init_opts=opts.InitOpts(theme=theme_opts, bg_color=self.bg_color)).add_xaxis(xaxis_data=time_series)
         baseline_chart.add_yaxis(
             series_name=title, 
-            y_axis=data_series, 
+            y_axis=self._downsample(data_series), 
             is_step=is_step,
             areastyle_opts=opts.AreaStyleOpts(opacity=0.2, color=up_color) if area_style else None,
             is_smooth=True, 
@@ -804,7 +935,7 @@ class BaseChart:
         common_opts = self._common_global_opts(title=title, zoomable=zoomable, zoom_slider=zoom_slider, subplot=subplot, legend=legend, tools=tools, watermark=watermark)
 
         baseline_chart.set_global_opts(**{**specific_opts, **common_opts})
-        return baseline_chart
+        return self._large_data_profile(baseline_chart, len(time_series))
 
     def _add_line(self, line_chart: Line, data_series: List[float], title: str = 'Additional Line', yaxis_name='Line',
                   color: str = _EMERALD_GREEN, is_step: bool = False, is_smooth:bool=True, area_style: bool = False, gradient_color: Dict = None, 
@@ -853,7 +984,7 @@ class BaseChart:
         
         line_chart.add_yaxis(
             series_name=yaxis_name, 
-            y_axis=data_series, 
+            y_axis=self._downsample(data_series), 
             is_step=is_step,
             areastyle_opts=areastyle_opts,
             is_smooth=is_smooth, 
@@ -861,7 +992,7 @@ class BaseChart:
             linestyle_opts=opts.LineStyleOpts(color=color),
             itemstyle_opts=opts.ItemStyleOpts(color=color),
         )
-        return line_chart
+        return self._large_data_profile(line_chart, len(line_chart.options['series'][-1]['data']))
 
     def _multi_lines(self, time_series: List[str], series_list: List[List[float]], color_list: List[str], 
                      title_list: List[str] = ["Indicator"], yaxis_name:str='Price', right_y:bool=False, mark_points_data: List[opts.MarkPointItem] = None, 
@@ -895,7 +1026,7 @@ class BaseChart:
         for name, color, series in zip(title_list, color_list, series_list):
             line_chart.add_yaxis(
                 series_name=name,
-                y_axis=series,
+                y_axis=self._downsample(series),
                 is_smooth=True,
                 linestyle_opts=opts.LineStyleOpts(width=1, color=color),
                 is_symbol_show=False,
@@ -925,7 +1056,7 @@ class BaseChart:
         common_opts = self._common_global_opts(title=title_list[0], zoomable=zoomable, zoom_slider=True, subplot=subplot, legend=legend, tools=False, watermark=watermark)
 
         line_chart.set_global_opts(**{**specific_opts, **common_opts})
-        return line_chart
+        return self._large_data_profile(line_chart, len(time_series))
 
     def _bar(self, time_series: List[str], data_series: List[Union[Dict[str, Any], float]], title: str = 'Bar Chart', 
              yaxis_name: str = 'Price', right_y: bool = True, show_xaxis: bool = False,
@@ -960,6 +1091,7 @@ class BaseChart:
 
         yaxis_pos = "right" if right_y else "left"
 
+        data_series = self._downsample(data_series)
         if not all(isinstance(d, dict) and "itemStyle" in d for d in data_series):
             data_series = [{"value": d, "itemStyle": {"color": color}} for d in data_series]
 
@@ -1010,9 +1142,25 @@ class BaseChart:
         common_opts = self._common_global_opts(title=title, zoomable=zoomable, zoom_slider=zoom_slider, subplot=False, legend=legend, tools=tools, watermark=watermark)
 
         bar_chart.set_global_opts(**{**global_opts, **common_opts})
-        return bar_chart
+        return self._large_data_profile(bar_chart, len(time_series))
+
+    def _signed_histogram(self, data_series: Union[pd.Series, List[float]], colors: Tuple[str, str, str, str] = HISTOGRAM_COLORS) -> List[Dict[str, Any]]:
+        """
+        Bar data of a signed histogram, each bar styled by sign and direction (see signed_histogram_colors).
+        The classification runs after level-of-detail downsampling, on the bars that are actually drawn.
 
-    def _hist(self, time_series: List[str], data_series: pd.Series, title: str = 'Bar Chart', 
+        Args:
+            data_series (Union[pd.Series, List[float]]): Histogram values.
+            colors (Tuple[str, str, str, str]): Colors for positive rising, positive falling, negative falling and negative rising bars.
+
+        Returns:
+            List[Dict[str, Any]]: One {"value", "itemStyle"} item per bar.
+        """
+        values = self._downsample(data_series.to_list() if isinstance(data_series, pd.Series) else data_series)
+        bar_colors = signed_histogram_colors(values, colors).tolist()
+        return [{"value": value, "itemStyle": {"color": color}} for value, color in zip(values, bar_colors)]
+
+    def _hist(self, time_series: List[str], data_series: Union[pd.Series, List[Any]], title: str = 'Bar Chart', 
              yaxis_name: str = 'Price', right_y: bool = True, show_xaxis: bool = False,
              color: str = _EMERALD_GREEN, label: bool = False, zoomable: bool = True, 
              zoom_slider: bool = False, subplot: bool = False, legend: bool = False, 
@@ -1022,7 +1170,7 @@ class BaseChart:
 
         Args:
             time_series (List[str]): List of time series data.
-            data_series (pd.Series): Series data.
+            data_series (Union[pd.Series, List[Any]]): Series data, or bar items such as the output of _signed_histogram.
             title (str): Title of the bar chart.
             yaxis_name (str): Name of the y-axis.
             right_y (bool): Position of the y-axis.
@@ -1055,7 +1203,7 @@ class BaseChart:
             .add_xaxis(xaxis_data=time_series)
             .add_yaxis(
                 series_name=title,
-                y_axis=data_series.to_list(),
+                y_axis=self._downsample(data_series.to_list() if isinstance(data_series, pd.Series) else data_series),
                 itemstyle_opts=opts.ItemStyleOpts(color=color),
                 label_opts=opts.LabelOpts(is_show=label),
             )
@@ -1092,7 +1240,7 @@ class BaseChart:
         common_opts = self._common_global_opts(title=title, zoomable=zoomable, zoom_slider=zoom_slider, subplot=False, legend=legend, tools=tools, watermark=watermark)
 
         bar_chart.set_global_opts(**{**global_opts, **common_opts})
-        return bar_chart
+        return self._large_data_profile(bar_chart, len(time_series))
 
     def _scatter(self, time_series: List[str], data_series: List[List[float]], title: str = 'Scatter Chart', 
                  yaxis_name: str = 'Price', right_y: bool = True,
@@ -1132,7 +1280,7 @@ class BaseChart:
         
         scatter_chart.add_yaxis(
             series_name=title,
-            y_axis=data_series,
+            y_axis=self._downsample(data_series),
             symbol_size=symbol_size,
             label_opts=opts.LabelOpts(is_show=label),
             itemstyle_opts=opts.ItemStyleOpts(color=color),
@@ -1157,7 +1305,169 @@ class BaseChart:
 
         common_opts = self._common_global_opts(title, zoomable, zoom_slider, subplot, legend, tools)
         scatter_chart.set_global_opts(**{**specific_opts, **common_opts})
-        return scatter_chart
+        return self._large_data_profile(scatter_chart, len(time_series))
+
+    def _heatmap(self, x_labels: List[str], y_labels: List[str], data_series: List[List[Any]], title: str = 'Heatmap',
+                 series_name: str = 'Value', value_range: Tuple[float, float] = (0, 100), label: bool = False,
+                 zoomable: bool = True, tools: bool = False, watermark: bool = False, chart_width: str = None, chart_height: str = None,
+                 **kwargs) -> HeatMap:
+        """
+        Create a heatmap of values on two category axes, colored from the bear color (low) to the bull color (high).
+
+        Args:
+            x_labels (List[str]): Categories of the x-axis (e.g. dates or symbols).
+            y_labels (List[str]): Categories of the y-axis (e.g. symbols or sectors).
+            data_series (List[List[Any]]): One [x index, y index, value] item per cell; extra items are passed
+                to the label formatter. Missing cells are simply left out.
+            title (str): Title of the chart.
+            series_name (str): Name of the values, shown in the tooltip.
+            value_range (Tuple[float, float]): Values mapped to the two ends of the color scale.
+            label (bool): Show the value in each cell.
+            zoomable (bool): Enable zoom on the x-axis.
+            tools (bool): Show toolbox and brush tools.
+            watermark (bool): Show watermark.
+            chart_width (str): Width of the chart. Default is None (chart width).
+            chart_height (str): Height of the chart. Default is None (chart height).
+
+        Keyword Args:
+            **kwargs: Additional keyword arguments.
+                - label_formatter (JsCode): Formatter of the cell labels.
+
+        Returns:
+            HeatMap: The configured HeatMap chart.
+        """
+        theme_opts = ThemeType.DARK if self.theme == 'DARK' else ThemeType.LIGHT
+        heatmap_chart = (
+            HeatMap(init_opts=opts.InitOpts(width=chart_width or self.chart_width, height=chart_height or self.chart_height,
+                                            theme=theme_opts, bg_color=self.bg_color))
+            .add_xaxis(x_labels)
+            .add_yaxis(
+                series_name=series_name,
+                yaxis_data=y_labels,
+                value=data_series,
+                label_opts=opts.LabelOpts(is_show=label, position="inside", formatter=kwargs.get("label_formatter"), font_size=10),
+            )
+        )
+
+        specific_opts = {
+            "xaxis_opts": opts.AxisOpts(type_="category", splitarea_opts=opts.SplitAreaOpts(is_show=False)),
+            "yaxis_opts": opts.AxisOpts(type_="category", is_inverse=True, splitarea_opts=opts.SplitAreaOpts(is_show=False)),
+            "visualmap_opts": opts.VisualMapOpts(
+                min_=value_range[0],
+                max_=value_range[1],
+                dimension=2,
+                is_calculable=True,
+                orient="horizontal",
+                pos_left="center",
+                pos_bottom="1%",
+                range_color=[self.bear_color, self.bg_color, self.bull_color],
+                textstyle_opts=opts.TextStyleOpts(color=self.text_color),
+            ),
+        }
+
+        common_opts = self._common_global_opts(title=title, zoomable=zoomable, zoom_slider=False, subplot=False, legend=False, tools=tools, watermark=watermark)
+        # The axis tooltip of the other charts would list a whole column; a heatmap describes the hovered cell.
+        common_opts["tooltip_opts"] = opts.TooltipOpts(trigger="item", background_color=self.bg_color, border_color="#ccc", border_width=1,
+                                                       textstyle_opts=opts.TextStyleOpts(color=self.text_color))
+        common_opts["axispointer_opts"] = None
+        if zoomable:
+            common_opts["datazoom_opts"] = [opts.DataZoomOpts(type_="inside", xaxis_index=[0], range_start=0, range_end=100)]
+        heatmap_chart.set_global_opts(**{**specific_opts, **common_opts})
+        return self._large_data_profile(heatmap_chart, len(data_series))
+
+    def _prepared(self, name: str, builder: Callable[[], Any]) -> Any:
+        """
+        Return a JSON-ready series prepared from the chart data, built once per data version.
+        The version is a fingerprint of the data's content, so edits made to the frame in place rebuild the series.
+
+        The prepared lists are shared by every chart layer built from the same data and must not be modified.
+
+        Args:
+            name (str): Cache key of the prepared series.
+            builder (Callable[[], Any]): Builds the series when it is not cached yet.
+        """
+        version = data_version(self.data)
+        if version != self._prepared_version:
+            self._prepared_version = version
+            self._prepared_series = {}
+        if name not in self._prepared_series:
+            self._prepared_series[name] = builder()
+        return self._prepared_series[name]
+
+    def _lod_edges(self) -> Union[np.ndarray, None]:
+        """
+        Level-of-detail bucket layout shared by all layers, None when the data fits in max_points.
+        """
+        return self._prepared('lod_edges', lambda: downsample.bucket_edges(len(self.data), self.max_points))
+
+    def _downsample(self, data_series: Any) -> Any:
+        """
+        Reduce a full-length numeric series to the level-of-detail buckets with LTTB.
+        Anything else (already reduced data, per-item payloads) is returned unchanged.
+        """
+        edges = self._lod_edges()
+        if edges is None or len(data_series) != len(self.data):
+            return data_series
+        if isinstance(data_series, list) and isinstance(data_series[0], (dict, list)):
+            return data_series
+        values = np.asarray(data_series, dtype=float)
+        return values[downsample.lttb(values, edges)].tolist()
+
+    def _time_format(self) -> str:
+        """
+        Format of the time labels: dates for daily and longer bars, with the time of day for intraday bars.
+        """
+        index = self.data.index
+        return self._prepared('time_format', lambda: '%Y-%m-%d' if (index == index.normalize()).all() else '%Y-%m-%d %H:%M')
+
+    def _time_index(self) -> List[str]:
+        """
+        Formatted time labels of the chart data, one per bucket when downsampled.
+        """
+        def build():
+            labels = self.data.index.strftime(self._time_format())
+            edges = self._lod_edges()
+            return (labels if edges is None else labels[edges[:-1]]).to_list()
+        return self._prepared('time_index', build)
+
+    def _ohlc_data(self) -> List[List[float]]:
+        """
+        Candlestick values in ECharts order: open, close, low, high.
+        """
+        def build():
+            edges = self._lod_edges()
+            if edges is None:
+                return self.data[['open', 'close', 'low', 'high']].values.tolist()
+            open_, high, low, close = downsample.aggregate_ohlc(*(self.data[c].to_numpy(dtype=float) for c in ('open', 'high', 'low', 'close')), edges)
+            return np.column_stack([open_, close, low, high]).tolist()
+        return self._prepared('ohlc', build)
+
+    def _close_data(self) -> List[float]:
+        return self._prepared('close', lambda: self._downsample(self.data['close'].values.tolist()))
+
+    def _volume_data(self) -> List[Dict[str, Any]]:
+        return self._prepared('volume', self._volume_payload)
+
+    def _volume_payload(self) -> List[Dict[str, Any]]:
+        """
+        Build the volume bar data, colored by candle direction, from NumPy arrays without touching the source DataFrame.
+
+        Returns:
+            List[Dict[str, Any]]: One {"value", "itemStyle"} item per bar.
+        """
+        open_, close, volume = self.data['open'].to_numpy(), self.data['close'].to_numpy(), self.data['volume'].to_numpy()
+        edges = self._lod_edges()
+        if edges is not None:
+            open_, close, volume = open_[edges[:-1]], close[edges[1:] - 1], downsample.aggregate_sum(volume, edges)
+        colors = np.where(open_ > close, self.bear_color, self.bull_color).tolist()
+        volumes = volume.tolist()
+        return [{"value": value, "itemStyle": {"color": color}} for value, color in zip(volumes, colors)]
+
+    def _pyramid(self) -> BarPyramid:
+        """
+        Multi-resolution OHLCV levels of the chart data, built once per data version.
+        """
+        return self._prepared('pyramid', lambda: BarPyramid(self.data))
 
     def _candlestick(self, title: str = "Candlestick Chart", yaxis_name:bool='Price', tools: bool =True, watermark: bool = True, display: bool = False) -> Grid:
         """
@@ -1173,15 +1483,9 @@ class BaseChart:
         Returns:
             Grid: A Grid object containing the candlestick and volume charts.
         """
-        time_index = self.data.index.strftime('%Y-%m-%d').to_list()
-        candle_data = self.data[['open', 'close', 'low', 'high']].values.tolist()
-        
-        self.data['itemStyleColor'] = np.where(self.data['open'] > self.data['close'], self.bear_color, self.bull_color)
-        
-        volume_data = [{
-            "value": row["volume"],
-            "itemStyle": {"color": row["itemStyleColor"]}
-        } for index, row in self.data.iterrows()]
+        time_index = self._time_index()
+        candle_data = self._ohlc_data()
+        volume_data = self._volume_data()
 
         kline = self._kline(time_series=time_index, ohlc_data=candle_data, title=title, yaxis_name=yaxis_name, right_y=True, tools=tools, watermark=watermark, show_xaxis=False)
         bar = self._volume(time_series=time_index, data_series=volume_data, title=title, yaxis_name='Volume')
@@ -1205,15 +1509,9 @@ class BaseChart:
         Returns:
             Grid: A Grid object containing the price area chart and volume chart.
         """
-        time_index = self.data.index.strftime('%Y-%m-%d').to_list()
-        close_data = self.data['close'].values.tolist()
-        
-        self.data['itemStyleColor'] = np.where(self.data['open'] > self.data['close'], self.bear_color, self.bull_color)
-        
-        volume_data = [{
-            "value": row["volume"],
-            "itemStyle": {"color": row["itemStyleColor"]}
-        } for index, row in self.data.iterrows()]
+        time_index = self._time_index()
+        close_data = self._close_data()
+        volume_data = self._volume_data()
 
         line = self._line(time_series=time_index, data_series=close_data, title=title, yaxis_name=yaxis_name, right_y=True, color=self.bull_color, area_style=area_style, zoomable=True, tools=tools, watermark=watermark, show_xaxis=False)
         bar = self._volume(time_series=time_index, data_series=volume_data, title=title, yaxis_name='Volume')
@@ -1241,6 +1539,7 @@ class BaseChart:
         """
         theme = theme.upper()
         set_theme = ThemeType.DARK if theme == "DARK" else ThemeType.LIGHT
+        animation = not self._is_large()
         if bg_color is None:
             bg_color = '#0E1117' if theme == "DARK" else '#FFFFFF'
 
@@ -1248,7 +1547,7 @@ class BaseChart:
             init_opts=opts.InitOpts(
                 width=chart_width,
                 height=chart_height,
-                animation_opts=opts.AnimationOpts(animation=True),
+                animation_opts=opts.AnimationOpts(animation=animation),
                 theme=set_theme,
                 bg_color=bg_color
             )
@@ -1293,6 +1592,134 @@ class BaseChart:
                     pos_left="3%", pos_right="7%", pos_top="80%", height="13%"
                 ),
             )
+        # Grid copies its top-level options from the first layer, so the init option alone is not enough.
+        grid_chart.options["animation"] = animation
+        if self.shared_dataset:
+            spec.share_dataset(grid_chart.options)
+        return grid_chart
+
+    def _stacked_layout(self, main_chart: Any, volume_chart: Any, subplots: List[Tuple[str, Any]], title: str = 'Dashboard',
+                        chart_height: str = None, chart_width: str = None, bg_color: str = None) -> Grid:
+        """
+        Stack the price panel, the volume panel and any number of indicator subplots in one grid.
+
+        All panels share the x-axis pointer and one pair of zoom controls covering every axis.
+
+        Args:
+            main_chart: The price layer, with its overlays already applied.
+            volume_chart: The volume layer.
+            subplots (List[Tuple[str, Any]]): (title, layer) of each indicator subplot, from top to bottom.
+            title (str): Title of the dashboard.
+            chart_height (str): Height of the chart. Default is None (chart height, plus 150px per extra subplot).
+            chart_width (str): Width of the chart. Default is None (chart width).
+            bg_color (str): Background color of the chart. Default is None (theme background).
+
+        Returns:
+            Grid: A Grid object containing the panels.
+        """
+        if chart_height is None:
+            chart_height = f"{int(self.chart_height.replace('px', '')) + 150 * max(len(subplots) - 1, 0)}px"
+        animation = not self._is_large()
+        grid_chart = Grid(
+            init_opts=opts.InitOpts(
+                width=chart_width or self.chart_width,
+                height=chart_height,
+                animation_opts=opts.AnimationOpts(animation=animation),
+                theme=ThemeType.DARK if self.theme == "DARK" else ThemeType.LIGHT,
+                bg_color=bg_color or self.bg_color
+            )
+        )
+
+        # Vertical space in percent: the price panel weighs 4, volume 1 and each subplot 1.5.
+        panels = [main_chart, volume_chart, *(layer for _, layer in subplots)]
+        weights = [4, 1] + [1.5] * len(subplots)
+        top, bottom, gap = 8, 8, 4
+        usable = 100 - top - bottom - gap * (len(panels) - 1)
+        panel_tops = []
+        for panel, weight in zip(panels, weights):
+            height = usable * weight / sum(weights)
+            grid_chart.add(panel, grid_opts=opts.GridOpts(pos_left="3%", pos_right="7%", pos_top=f"{top:.1f}%", height=f"{height:.1f}%"))
+            panel_tops.append(top)
+            top += height + gap
+
+        # The layers each bring zoom controls for the first three axes; replace them with one pair for all panels.
+        axes = list(range(len(panels)))
+        grid_chart.options["dataZoom"] = [
+            opts.DataZoomOpts(is_show=True, type_="slider", xaxis_index=axes, range_start=0, range_end=100, pos_bottom="1%"),
+            opts.DataZoomOpts(is_show=True, type_="inside", xaxis_index=axes, range_start=0, range_end=100),
+        ]
+        titles = list(opts.TitleOpts(title=title, pos_left='center', pos_top=20,
+                                 title_textstyle_opts=opts.TextStyleOpts(font_family=self.font_family, font_size=self.font_size * 1.5, color=self.text_color)).opts)
+        for (panel_title, _), panel_top in zip(subplots, panel_tops[2:]):
+            titles.extend(opts.TitleOpts(title=panel_title, pos_left="3%", pos_top=f"{panel_top - 3:.1f}%",
+                                         title_textstyle_opts=opts.TextStyleOpts(font_family=self.font_family, font_size=self.font_size * 0.7, color=self.text_color)).opts)
+        grid_chart.options["title"] = titles
+        grid_chart.options["animation"] = animation
+        if self.shared_dataset:
+            spec.share_dataset(grid_chart.options)
+        return grid_chart
+
+    def _multiples_layout(self, cells: List[Tuple[str, Any]], title: str = 'Market Overview', columns: int = 6, cell_height: int = 160,
+                          chart_width: str = None, bg_color: str = None) -> Grid:
+        """
+        Arrange small charts (sparklines, mini candles) in rows of `columns` cells of one grid, i.e. one ECharts instance.
+
+        The cells keep their own y-axis scale without labels, share one pair of zoom controls and show a tooltip
+        for the hovered cell only.
+
+        Args:
+            cells (List[Tuple[str, Any]]): (title, layer) of each cell, row by row.
+            title (str): Title of the page.
+            columns (int): Number of cells per row. Default is 6.
+            cell_height (int): Height of a row in pixels, title included. Default is 160.
+            chart_width (str): Width of the chart. Default is None (chart width).
+            bg_color (str): Background color of the chart. Default is None (theme background).
+
+        Returns:
+            Grid: A Grid object containing the cells.
+        """
+        if columns < 1:
+            raise ValueError(f"columns must be at least 1, got {columns}")
+        rows = -(-len(cells) // columns)
+        # Vertical space in pixels: page title, rows of cells (cell title, plot, gap) and the zoom slider.
+        header, footer, title_gap, row_gap = 70, 50, 20, 12
+        cell_width = 96 / columns
+        animation = not self._is_large(len(cells) * len(self._time_index()))
+        grid_chart = Grid(
+            init_opts=opts.InitOpts(
+                width=chart_width or self.chart_width,
+                height=f"{header + rows * cell_height + footer}px",
+                animation_opts=opts.AnimationOpts(animation=animation),
+                theme=ThemeType.DARK if self.theme == "DARK" else ThemeType.LIGHT,
+                bg_color=bg_color or self.bg_color
+            )
+        )
+        titles = list(opts.TitleOpts(title=title, pos_left='center', pos_top=20,
+                                     title_textstyle_opts=opts.TextStyleOpts(font_family=self.font_family, font_size=self.font_size * 1.5, color=self.text_color)).opts)
+        for position, (cell_title, layer) in enumerate(cells):
+            row, column = divmod(position, columns)
+            left, top = 2 + column * cell_width, header + row * cell_height
+            grid_chart.add(layer, grid_opts=opts.GridOpts(pos_left=f"{left + 0.5:.2f}%", width=f"{cell_width - 1:.2f}%",
+                                                          pos_top=f"{top + title_gap}px", height=f"{cell_height - title_gap - row_gap}px"))
+            titles.extend(opts.TitleOpts(title=cell_title, pos_left=f"{left + 0.5:.2f}%", pos_top=f"{top}px",
+                                         title_textstyle_opts=opts.TextStyleOpts(font_family=self.font_family, font_size=self.font_size * 0.6, color=self.text_color)).opts)
+
+        for axis in grid_chart.options["xAxis"]:
+            axis.update(axisLabel={"show": False}, axisTick={"show": False}, splitLine={"show": False})
+        for axis in grid_chart.options["yAxis"]:
+            axis.update(name=None, scale=True, axisLabel={"show": False}, axisTick={"show": False}, splitLine={"show": False})
+        axes = list(range(len(cells)))
+        grid_chart.options["dataZoom"] = [
+            opts.DataZoomOpts(is_show=True, type_="slider", xaxis_index=axes, range_start=0, range_end=100, pos_bottom="10px"),
+            opts.DataZoomOpts(is_show=True, type_="inside", xaxis_index=axes, range_start=0, range_end=100),
+        ]
+        # The layers link their axis pointers and color candles through visualMaps; a cell stands on its own here.
+        grid_chart.options["axisPointer"] = opts.AxisPointerOpts(is_show=True, label=opts.LabelOpts(background_color="#777"))
+        grid_chart.options["visualMap"] = None
+        grid_chart.options["title"] = titles
+        grid_chart.options["animation"] = animation
+        if self.shared_dataset:
+            spec.share_dataset(grid_chart.options)
         return grid_chart
 
     def base_trading_chart(self, title: str = 'Candlestick Chart', display: bool = True, tools:bool=True, watermark: bool = True, chart_width='1500px', chart_height='900px') -> Union[pn.pane.ECharts, str]:
@@ -1346,27 +1773,85 @@ class BaseChart:
         grid_chart = self._grid_layout(chart_series={'MainChart': line, 'Volume': bar}, layout='minimal', chart_height=self.chart_height, chart_width=self.chart_width, theme=self.theme, bg_color=self.bg_color)
         return self._render(chart=grid_chart, display=display)
 
+    def zoom_trading_chart(self, start: Union[str, pd.Timestamp] = None, end: Union[str, pd.Timestamp] = None, max_points: int = 2000,
+                           title: str = 'Candlestick Chart', display: bool = True, tools: bool = True, watermark: bool = True,
+                           chart_width='1500px', chart_height='900px') -> Union[pn.pane.ECharts, str]:
+        """
+        Create a candlestick and volume chart of the range [start, end] at the finest resolution that fits in
+        `max_points` bars, e.g. 5-minute bars for a week of 1-minute data and daily bars for several years.
+        The aggregation levels are computed once and reused by every zoom on the same data.
+
+        Args:
+            start: First timestamp of the range. Default is None (start of the data).
+            end: Last timestamp of the range. Default is None (end of the data).
+            max_points (int): Maximum number of bars sent to the browser. Default is 2000.
+            title (str): Title of the chart.
+            display (bool): Render the chart directly or just return the raw chart object.
+            watermark (bool): Show watermark.
+
+        Returns:
+            Union[pn.pane.ECharts, str]: The rendered chart or raw chart object.
+        """
+        _, bars = self._pyramid().level_for(start, end, max_points)
+        level_chart = BaseChart(bars, theme=self.theme, color_category=self.color_category, width=self.width, height=self.height,
+                                large_threshold=self.large_threshold, shared_dataset=self.shared_dataset)
+        return level_chart.base_trading_chart(title=title, display=display, tools=tools, watermark=watermark, chart_width=chart_width, chart_height=chart_height)
+
+class ChartContext:
+    def __init__(self, data: pd.DataFrame, theme: str = "dark", max_points: int = None, shared_dataset: bool = False):
+        """
+        Data, indicator engine and chart configuration shared by the TAChart families of one Plotter.
+
+        Args:
+            data (pd.DataFrame): The OHLCV data.
+            theme (str): Theme of the chart.
+            max_points (int): Maximum number of points per series before downsampling. Default is None (all points).
+            shared_dataset (bool): Emit the series data as one shared ECharts dataset. Default is False.
+        """
+        self.data = data
+        self.theme = theme
+        self.max_points = max_points
+        self.shared_dataset = shared_dataset
+
+    @functools.cached_property
+    def ta(self):
+        from vnstock_ta.interface import Indicator
+        return Indicator(data=self.data)
+
+    @functools.cached_property
+    def chart(self) -> BaseChart:
+        return BaseChart(candle_data=self.data, theme=self.theme, max_points=self.max_points, shared_dataset=self.shared_dataset)
+
 class TAChart:
-    def __init__ (self, data, theme:str="dark", watermark:bool=False, display:bool=True):
+    def __init__ (self, data, theme:str="dark", watermark:bool=False, display:bool=True, context: ChartContext = None, max_points: int = None,
+                  shared_dataset: bool = False):
         """
         Initialize the TAChart class.
 
         Args:
             data (pd.DataFrame): The OHLCV data.
             theme (str): Theme of the chart.
-            width (str): Width of the chart.
-            height (str): Height of the chart.
+            watermark (bool): Show watermark on the chart.
+            display (bool): Render the chart directly or just return the raw chart object.
+            context (ChartContext): Indicator engine and BaseChart shared with other TAChart families. Default is None (own context).
+            max_points (int): Maximum number of points per series before downsampling, used when no context is given. Default is None.
+            shared_dataset (bool): Emit the series data as one shared ECharts dataset, used when no context is given. Default is False.
         """
         self.data = data
         self.theme = theme
         self.watermark = watermark
         self.display = display
-        self.ta = self._import_indicator()(data=self.data)
-        self.chart = BaseChart(candle_data=self.data, theme=self.theme)
+        self.context = context if context is not None else ChartContext(data, theme, max_points, shared_dataset)
+        # In collect mode the indicator methods return (title, indicator layer) instead of a full chart, see Plotter.dashboard.
+        self._collect = False
 
-    def _import_indicator(self):
-        from vnstock_ta.interface import Indicator
-        return Indicator
+    @property
+    def ta(self):
+        return self.context.ta
+
+    @property
+    def chart(self) -> BaseChart:
+        return self.context.chart
     
     # def _show_html(self, html:str):
 
@@ -1382,6 +1867,9 @@ class TAChart:
             layout (str): Layout of the chart.
             watermark (bool): Show watermark.
         """
+        if self._collect:
+            return title, indicator_chart
+
         if watermark:
             show_watermark = watermark
         else:
@@ -1414,6 +1902,9 @@ class TAChart:
             layout (str): Layout of the chart.
             watermark (bool): Show watermark.
         """
+        if self._collect:
+            return title, indicator_chart
+
         if watermark:
             show_watermark = watermark
         else:
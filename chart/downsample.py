@@ -0,0 +1,79 @@
+import numpy as np
+from typing import Optional, Tuple
+
+# All layers of a chart share one bucket layout so that candles, volume and indicator lines stay
+# aligned on the category axis: one bucket becomes one point, labelled with its first timestamp.
+
+
+def bucket_edges(n: int, max_points: int) -> Optional[np.ndarray]:
+    """
+    Split n rows into at most `max_points` buckets. The first and last rows get a bucket of their own,
+    as LTTB requires, and the rows in between are shared evenly by the remaining buckets.
+
+    Args:
+        n (int): Number of rows.
+        max_points (int): Maximum number of points to keep.
+
+    Returns:
+        Optional[np.ndarray]: Bucket start positions followed by n, or None when no downsampling is needed.
+    """
+    if not max_points or n <= max_points:
+        return None
+    if max_points < 3:
+        raise ValueError(f"max_points must be at least 3, got {max_points}")
+    middle = np.floor(np.linspace(1, n - 1, max_points - 1)).astype(np.int64)
+    return np.concatenate([[0], middle, [n]])
+
+
+def lttb(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets selection: keep, in every bucket, the point forming the largest triangle
+    with the point kept in the previous bucket and the average of the next one. Peaks and troughs survive.
+
+    Args:
+        values (np.ndarray): Series values, NaN allowed (e.g. indicator warm-up).
+        edges (np.ndarray): Bucket layout from bucket_edges.
+
+    Returns:
+        np.ndarray: Index of the point kept in each bucket.
+    """
+    n_buckets = len(edges) - 1
+    selected = np.empty(n_buckets, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = len(values) - 1
+    for b in range(1, n_buckets - 1):
+        start, stop, next_stop = edges[b], edges[b + 1], edges[b + 2]
+        prev_x = selected[b - 1]
+        prev_y = values[prev_x]
+        bucket = values[start:stop]
+        following = values[stop:next_stop]
+        finite = np.isfinite(bucket)
+        if not finite.any():
+            selected[b] = start
+            continue
+        if np.isnan(prev_y) or not np.isfinite(following).any():
+            selected[b] = start + np.flatnonzero(finite)[0]
+            continue
+        avg_x = (stop + next_stop - 1) / 2
+        avg_y = np.nanmean(following)
+        xs = np.arange(start, stop)
+        area = np.abs((prev_x - avg_x) * (bucket - prev_y) - (prev_x - xs) * (avg_y - prev_y))
+        selected[b] = start + np.nanargmax(area)
+    return selected
+
+
+def aggregate_ohlc(open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                   edges: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Aggregate candles per bucket: first open, highest high, lowest low and last close, so extremes stay visible.
+    """
+    starts = edges[:-1]
+    ends = edges[1:] - 1
+    return open_[starts], np.maximum.reduceat(high, starts), np.minimum.reduceat(low, starts), close[ends]
+
+
+def aggregate_sum(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Sum values per bucket, e.g. traded volume.
+    """
+    return np.add.reduceat(values, edges[:-1])
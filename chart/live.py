@@ -0,0 +1,187 @@
+import uuid
+import pandas as pd
+from typing import Any, Dict, List, Tuple, Union
+from vnstock_ta.chart.core import BaseChart
+from vnstock_ta.chart import spec
+
+try:
+    from IPython.display import display, Javascript
+    IS_NOTEBOOK = True
+except ImportError:
+    IS_NOTEBOOK = False
+
+IndicatorSpec = Union[str, Tuple[str, Dict[str, Any]]]
+
+# Applies an update payload to a rendered chart: drops the last `drop` points of the time axes and of
+# every series, then appends the new points. Only axis and series data are passed to setOption, so the
+# zoom window, styles and the rest of the option are kept.
+APPLY_UPDATE_JS = """
+function applyChartUpdate(chart, update) {
+    var option = chart.getOption();
+    var xAxis = option.xAxis.map(function (axis) {
+        if (!axis.data) { return {}; }
+        return {data: axis.data.slice(0, axis.data.length - update.drop).concat(update.time)};
+    });
+    var series = option.series.map(function (series, i) {
+        return {data: series.data.slice(0, series.data.length - update.drop).concat(update.series[i] || [])};
+    });
+    chart.setOption({xAxis: xAxis, series: series});
+}
+"""
+
+
+class LiveChart:
+    def __init__(self, data: pd.DataFrame, overlays: List[IndicatorSpec] = None, subplots: List[IndicatorSpec] = None,
+                 title: str = 'Live Chart', theme: str = 'light', chart_id: str = None, width: str = None, height: str = None):
+        """
+        Candlestick chart that is rendered once and then updated in place with new or revised bars.
+
+        Each update only sends the changed bars and the matching indicator values, computed with the
+        indicators' tail mode, and the browser applies them with a partial setOption.
+
+        Args:
+            data (pd.DataFrame): The OHLCV data.
+            overlays (List[IndicatorSpec]): Indicators drawn on the price panel, as Indicator method names ('sma') or
+                (name, params) pairs (('bbands', {'length': 20})).
+            subplots (List[IndicatorSpec]): Indicators drawn in their own panel, in the same format.
+            title (str): Title of the chart.
+            theme (str): 'light' or 'dark'. Default is 'light'.
+            chart_id (str): Id of the chart element in the page. Default is None (a unique id).
+            width (str): Width of the chart. Default is None (1500px).
+            height (str): Height of the chart. Default is None (900px, plus 150px per extra subplot).
+        """
+        self.data = data
+        self.overlays = [_parse_indicator(indicator) for indicator in overlays or []]
+        self.subplots = [_parse_indicator(indicator) for indicator in subplots or []]
+        self.title = title
+        self.chart_id = chart_id or f"vnstock_ta_live_{uuid.uuid4().hex[:12]}"
+        self.width = width
+        self.height = height
+        self.chart = BaseChart(candle_data=data, theme=theme)
+        self._time_format = self.chart._time_format()
+
+    def build(self) -> Any:
+        """
+        Build the full chart of the current data.
+
+        The series are, in order: candlesticks, the overlay lines, volume and the subplot lines.
+        Update payloads follow the same order.
+        """
+        chart = self.chart
+        time_index = chart._time_index()
+        main_chart = chart._kline(time_series=time_index, ohlc_data=chart._ohlc_data(), title=self.title, tools=False, show_xaxis=False)
+        for name, params in self.overlays:
+            main_chart = main_chart.overlap(self._indicator_lines(time_index, name, params))
+        volume_chart = chart._volume(time_series=time_index, data_series=chart._volume_data())
+        subplots = [(name.upper(), self._indicator_lines(time_index, name, params)) for name, params in self.subplots]
+        grid_chart = chart._stacked_layout(main_chart, volume_chart, subplots, title=self.title, chart_height=self.height, chart_width=self.width)
+        grid_chart.chart_id = self.chart_id
+        return grid_chart
+
+    def show(self, display: Union[bool, str] = True) -> Any:
+        """
+        Render the chart once. Later bars are sent with update().
+        """
+        return self.chart._render(self.build(), display=display)
+
+    def payload(self, bars: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Merge new bars into the data and return the update to apply to the rendered chart.
+
+        Bars at or after an existing timestamp replace it and everything after it (e.g. the still forming
+        last bar); later bars are appended.
+
+        Args:
+            bars (pd.DataFrame): New OHLCV bars, in time order.
+
+        Returns:
+            Dict[str, Any]: {"drop": number of points to remove from the end, "time": new time labels,
+                "series": new points of each series, in the order of build()}. The points have the same
+                shape and precision as in build(): [open, close, low, high] candles, {"value", "itemStyle"}
+                volume bars and [time, value] line points.
+        """
+        if bars.empty:
+            return {"drop": 0, "time": [], "series": []}
+        position = self.data.index.searchsorted(bars.index[0])
+        drop = int(len(self.data) - position)
+        self.data = pd.concat([self.data.iloc[:position], bars[self.data.columns]])
+        self.chart.data = self.data
+        changed = len(bars)
+
+        new = self.data.iloc[-changed:]
+        time_index = new.index.strftime(self._time_format).to_list()
+        candles = new[['open', 'close', 'low', 'high']].values.tolist()
+        colors = [self.chart.bear_color if open_ > close else self.chart.bull_color for open_, close in zip(new['open'], new['close'])]
+        volume = [{"value": value, "itemStyle": {"color": color}} for value, color in zip(new['volume'].tolist(), colors)]
+        overlays = [_line_points(time_index, values) for name, params in self.overlays
+                    for _, values in self._indicator_columns(name, params, tail=changed)]
+        subplots = [_line_points(time_index, values) for name, params in self.subplots
+                    for _, values in self._indicator_columns(name, params, tail=changed)]
+        return {
+            "drop": drop,
+            "time": time_index,
+            "series": [candles, *overlays, volume, *subplots],
+        }
+
+    def script(self, update: Dict[str, Any]) -> str:
+        """
+        JavaScript that applies an update payload to the chart element of this LiveChart.
+        """
+        return f"""
+(function () {{
+    {APPLY_UPDATE_JS}
+    function apply(echarts) {{
+        var dom = document.getElementById('{self.chart_id}');
+        var chart = dom && echarts.getInstanceByDom(dom);
+        if (chart) {{ applyChartUpdate(chart, {spec.dumps(update)}); }}
+    }}
+    if (typeof echarts !== 'undefined') {{ apply(echarts); }}
+    else if (typeof require !== 'undefined') {{ require(['echarts'], apply); }}
+}})();
+"""
+
+    def update(self, bars: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Merge new bars and push them to the chart rendered in the notebook.
+
+        Args:
+            bars (pd.DataFrame): New OHLCV bars, in time order.
+
+        Returns:
+            Dict[str, Any]: The update payload, see payload().
+        """
+        update = self.payload(bars)
+        if IS_NOTEBOOK and update["time"]:
+            display(Javascript(self.script(update)))
+        return update
+
+    def _indicator_columns(self, name: str, params: Dict[str, Any], tail: int = None) -> List[Tuple[str, List[Any]]]:
+        from vnstock_ta.interface import Indicator
+        result = getattr(Indicator(self.data), name)(**params, tail=tail)
+        if isinstance(result, pd.Series):
+            columns = [(str(result.name), result.to_numpy())]
+        elif isinstance(result, pd.DataFrame):
+            columns = [(str(column), result[column].to_numpy()) for column in result.columns]
+        else:
+            columns = [(str(column), values) for column, values in result.items()]
+        return [(column, spec.round_values(values)) for column, values in columns]
+
+    def _indicator_lines(self, time_index: List[str], name: str, params: Dict[str, Any]) -> Any:
+        columns = self._indicator_columns(name, params)
+        chart = self.chart
+        palette = [chart.indicator_color, chart.indicator_1_color, chart.indicator_2_color, chart.indicator_3_color,
+                   chart.indicator_4_color, chart.indicator_5_color]
+        colors = [palette[i % len(palette)] for i in range(len(columns))]
+        return chart._multi_lines(time_series=time_index, series_list=[values for _, values in columns], color_list=colors,
+                                  title_list=[column for column, _ in columns], yaxis_name=name.upper())
+
+
+def _line_points(time_index: List[str], values: List[Any]) -> List[List[Any]]:
+    """
+    [time, value] points of a line series, as pyecharts writes them in build().
+    """
+    return [[time, value] for time, value in zip(time_index, values)]
+
+
+def _parse_indicator(indicator: IndicatorSpec) -> Tuple[str, Dict[str, Any]]:
+    return (indicator, {}) if isinstance(indicator, str) else (indicator[0], dict(indicator[1]))
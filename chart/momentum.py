@@ -1,15 +1,15 @@
 import pandas as pd
 from pyecharts import options as opts
-from pyecharts.commons.utils import JsCode
 from vnstock_ta.utils.const import _ISLAND_GREEN, _ORANGE, _TURKISH_SEA, _SLATE_BLUE, _LIME_PUNCH, _GRADIENT_EMERALD, NEUTRAL_INFORMATION_COMPLETE, DARK_MODE_PRIMARY_COLORS, DARK_MODE_SECONDARY_COLORS, LIGHT_MODE_PRIMARY_COLORS, LIGHT_MODE_SECONDARY_COLORS
-from vnstock_ta.chart.core import TAChart
+from vnstock_ta.chart.core import TAChart, ChartContext
 
 
 # extend the TAChart class
 
 class TAMomentum(TAChart):
-    def __init__(self, data: pd.DataFrame, theme: str = 'light', watermark: bool = True, display: bool = True):
-        super().__init__(data, theme, watermark, display)
+    def __init__(self, data: pd.DataFrame, theme: str = 'light', watermark: bool = True, display: bool = True, context: ChartContext = None,
+                 max_points: int = None, shared_dataset: bool = False):
+        super().__init__(data, theme, watermark, display, context, max_points, shared_dataset)
 
     def rsi (self, length:int=14, title='Relative Strength Index', color=_ISLAND_GREEN, 
                     legend=False, watermark=True, minimal:bool=False):
@@ -20,7 +20,7 @@ class TAMomentum(TAChart):
             indicator_color = self.chart.mono_color
 
         indicator_data = self.ta.rsi(length=length).round(2)
-        time_index = self.data.index.strftime('%Y-%m-%d').tolist()
+        time_index = self.chart._time_index()
         markline = opts.MarkLineOpts(data=[opts.MarkLineItem(y=70, name="Quá mua", 
                                                              linestyle_opts=opts.LineStyleOpts(width=1, color=_SLATE_BLUE, opacity=0.5, type_='dashed')),
                                             opts.MarkLineItem(y=30, name="Quá bán", 
@@ -49,35 +49,14 @@ class TAMomentum(TAChart):
         macd_signal = indicator_data.iloc[:, 2]
         macd_histogram = indicator_data.iloc[:, 1] 
 
-        def determine_color(histogram, prev_histogram):
-            if histogram > 0 and histogram >= prev_histogram:
-                return "#3CB371"  # Green
-            elif histogram > 0 and histogram < prev_histogram:
-                return "#90EE90"  # Light Green
-            elif histogram < 0 and histogram <= prev_histogram:
-                return "#FF6347"  # Red
-            elif histogram < 0 and histogram > prev_histogram:
-                return "#FFB6C1"  # Light Red
-            else:
-                return "#000000"  # Should not be reached
-
-        hist_colors = [determine_color(macd_histogram.iloc[i], macd_histogram.iloc[i-1] if i > 0 else 0) for i in range(len(indicator_data))]
-        indicator_color = JsCode(
-                            """
-                            function(params) {
-                                var colors = %s;
-                                return colors[params.dataIndex];
-                            }
-                            """ % hist_colors
-                        )        
-
-        time_index = self.data.index.strftime('%Y-%m-%d').tolist()
+        time_index = self.chart._time_index()
         indicator_line = self.chart._line(time_series=time_index, data_series=macd_line, color=indicator_color, title=title, yaxis_name='MACD', 
                                           legend=legend, watermark=watermark, show_xaxis=False)
         
         indicator_line = self.chart._add_line(line_chart=indicator_line, data_series=macd_signal, color=_ISLAND_GREEN, title='', yaxis_name='Signal')
         
-        histogram_bar = self.chart._hist(time_series=time_index, data_series=macd_histogram, title='', color=indicator_color, yaxis_name='Histogram', show_xaxis=False)
+        histogram_bar = self.chart._hist(time_series=time_index, data_series=self.chart._signed_histogram(macd_histogram), title='', color=indicator_color,
+                                         yaxis_name='Histogram', show_xaxis=False)
 
         subplots = histogram_bar.overlap(indicator_line)
 
@@ -95,7 +74,7 @@ class TAMomentum(TAChart):
             indicator_color = self.chart.mono_color
 
         indicator_data = self.ta.willr(length=length).round(2)
-        time_index = self.data.index.strftime('%Y-%m-%d').tolist()
+        time_index = self.chart._time_index()
         markline = opts.MarkLineOpts(data=[opts.MarkLineItem(y=-20, name="Quá mua", 
                                                              linestyle_opts=opts.LineStyleOpts(width=1, color=_SLATE_BLUE, opacity=0.5, type_='dashed')),
                                             opts.MarkLineItem(y=-80, name="Quá bán", 
@@ -119,7 +98,7 @@ class TAMomentum(TAChart):
             indicator_color = self.chart.mono_color
 
         indicator_data = self.ta.cmo(length=length).round(2)
-        time_index = self.data.index.strftime('%Y-%m-%d').tolist()
+        time_index = self.chart._time_index()
         indicator_line = self.chart._line(time_series=time_index, data_series=indicator_data, color=indicator_color, title=title, yaxis_name='CMO', is_smooth=False,
                                           legend=legend, watermark=watermark, show_xaxis=False)
 
@@ -140,7 +119,7 @@ class TAMomentum(TAChart):
         stoch_k = indicator_data.iloc[:, 0]
         stoch_d = indicator_data.iloc[:, 1]
 
-        time_index = self.data.index.strftime('%Y-%m-%d').tolist()
+        time_index = self.chart._time_index()
 
         markline = opts.MarkLineOpts(data=[opts.MarkLineItem(y=80, name="Quá mua", 
                                                              linestyle_opts=opts.LineStyleOpts(width=1, color=_SLATE_BLUE, opacity=0.5, type_='dashed')),
@@ -167,7 +146,7 @@ class TAMomentum(TAChart):
             indicator_color = self.chart.mono_color
 
         indicator_data = self.ta.roc(length=length).round(2)
-        time_index = self.data.index.strftime('%Y-%m-%d').tolist()
+        time_index = self.chart._time_index()
         indicator_line = self.chart._line(time_series=time_index, data_series=indicator_data, color=indicator_color, title=title, yaxis_name='ROC', is_smooth=False,
                                           legend=legend, watermark=watermark, show_xaxis=False)
 
@@ -185,7 +164,7 @@ class TAMomentum(TAChart):
             indicator_color = self.chart.mono_color
 
         indicator_data = self.ta.mom(length=length).round(2)
-        time_index = self.data.index.strftime('%Y-%m-%d').tolist()
+        time_index = self.chart._time_index()
         indicator_line = self.chart._line(time_series=time_index, data_series=indicator_data, color=indicator_color, title=title, yaxis_name='MOM', is_smooth=False,
                                           legend=legend, watermark=watermark, show_xaxis=False)
 
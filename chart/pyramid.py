@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+from typing import Dict, List, Sequence, Tuple, Union
+
+# Coarser levels are resampled from the previous level rather than from the base bars, so building
+# the whole pyramid costs little more than the first aggregation. Weekly bars start on Monday.
+DEFAULT_LEVELS = ('5min', '30min', '1D', 'W-MON')
+
+OHLCV_AGG = {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'}
+
+
+class BarPyramid:
+    def __init__(self, data: pd.DataFrame, levels: Sequence[str] = DEFAULT_LEVELS):
+        """
+        Pre-aggregated OHLCV levels of a price series, from the base bars up to the coarsest level.
+
+        Args:
+            data (pd.DataFrame): OHLCV data with a DatetimeIndex, the finest level of the pyramid.
+            levels (Sequence[str]): Pandas resample rules, from fine to coarse. Levels that would not
+                reduce the number of bars (e.g. intraday rules on daily data) are skipped, rules no coarser
+                than the typical bar spacing without being resampled at all.
+        """
+        if not isinstance(data.index, pd.DatetimeIndex):
+            raise ValueError("BarPyramid requires data with a DatetimeIndex")
+        self.levels: List[Tuple[str, pd.DataFrame]] = [('base', data)]
+        for rule in levels:
+            previous = self.levels[-1][1]
+            if _rule_span(rule) <= _bar_spacing(previous.index):
+                continue
+            agg = {column: how for column, how in OHLCV_AGG.items() if column in previous.columns}
+            frame = previous.resample(rule, label='left', closed='left').agg(agg).dropna(subset=['close'])
+            if len(frame) < len(previous):
+                self.levels.append((rule, frame))
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    @property
+    def sizes(self) -> Dict[str, int]:
+        """
+        Number of bars per level.
+        """
+        return {rule: len(frame) for rule, frame in self.levels}
+
+    def level_for(self, start: Union[str, pd.Timestamp] = None, end: Union[str, pd.Timestamp] = None,
+                  max_points: int = 2000) -> Tuple[str, pd.DataFrame]:
+        """
+        Pick the finest level that shows the time range [start, end] in at most `max_points` bars.
+
+        Args:
+            start: First timestamp of the visible range. Default is None (start of the data).
+            end: Last timestamp of the visible range. Default is None (end of the data).
+            max_points (int): Maximum number of bars to return.
+
+        Returns:
+            Tuple[str, pd.DataFrame]: The level's resample rule ('base' for the original bars) and its bars within the range.
+                The coarsest level is returned when no level fits.
+        """
+        for rule, frame in self.levels:
+            window = frame.loc[start:end]
+            if len(window) <= max_points:
+                return rule, window
+        return rule, window
+
+
+def _bar_spacing(index: pd.DatetimeIndex) -> pd.Timedelta:
+    """
+    Median time between two consecutive bars, 0 for fewer than two bars.
+    """
+    if len(index) < 2:
+        return pd.Timedelta(0)
+    return pd.Timedelta(int(np.median(np.diff(index.asi8))))
+
+
+def _rule_span(rule: str) -> pd.Timedelta:
+    """
+    Length of one bin of a resample rule. Calendar rules (weeks, months) are measured between two
+    consecutive anchors, e.g. 7 days for 'W-MON'.
+    """
+    offset = to_offset(rule)
+    anchor = pd.Timestamp('2000-01-03') + offset
+    return (anchor + offset) - anchor
@@ -0,0 +1,245 @@
+import os
+import abc
+import asyncio
+import collections
+import pandas as pd
+import tornado.web
+import tornado.ioloop
+import tornado.websocket
+from typing import AsyncIterator, Deque, Dict, List, Tuple, Union
+from vnstock_ta.chart import assets, spec
+from vnstock_ta.chart.live import LiveChart, IndicatorSpec, APPLY_UPDATE_JS
+
+# Number of recent updates kept per symbol, replayed to viewers that connect between page load and websocket open.
+UPDATE_BACKLOG = 100
+
+# Appended to the chart page: connects to the symbol's websocket and applies each update to the chart.
+CLIENT_JS = """
+<script>
+%(apply_update)s
+(function () {
+    var sequence = %(sequence)d;
+    var protocol = window.location.protocol === 'https:' ? 'wss://' : 'ws://';
+    var socket = new WebSocket(protocol + window.location.host + '/ws/%(symbol)s?since=' + sequence);
+    socket.onmessage = function (event) {
+        var message = JSON.parse(event.data);
+        if (message.reload) { window.location.reload(); return; }
+        if (message.sequence <= sequence) { return; }
+        sequence = message.sequence;
+        var chart = echarts.getInstanceByDom(document.getElementById('%(chart_id)s'));
+        if (chart) { applyChartUpdate(chart, message.update); }
+    };
+})();
+</script>
+"""
+
+
+class BarFeed(abc.ABC):
+    """
+    Source of bars for the chart server: the history a chart starts from, then new or revised bars as they come.
+    Subclass it to plug in a broker or exchange feed.
+    """
+    @abc.abstractmethod
+    def history(self, symbol: str) -> pd.DataFrame:
+        """
+        Return the OHLCV bars a chart of `symbol` starts with.
+        """
+
+    @abc.abstractmethod
+    def stream(self, symbol: str) -> AsyncIterator[pd.DataFrame]:
+        """
+        Yield frames of new bars for `symbol`. A bar at an existing timestamp revises it.
+        """
+
+
+class ReplayFeed(BarFeed):
+    def __init__(self, sources: Dict[str, Union[str, pd.DataFrame]], history: int = 500, interval: float = 1.0, batch: int = 1):
+        """
+        Replay stored bars as if they were arriving live, for testing and demos.
+
+        Args:
+            sources (Dict[str, Union[str, pd.DataFrame]]): OHLCV data per symbol, as a DataFrame or the path of a
+                CSV or Parquet file with a time column or index.
+            history (int): Number of bars the charts start with. Default is 500.
+            interval (float): Seconds between two replayed batches. Default is 1.0.
+            batch (int): Number of bars per batch. Default is 1.
+        """
+        self.sources = sources
+        self.history_rows = history
+        self.interval = interval
+        self.batch = batch
+        self._frames: Dict[str, pd.DataFrame] = {}
+
+    def _frame(self, symbol: str) -> pd.DataFrame:
+        if symbol not in self._frames:
+            source = self.sources[symbol]
+            if isinstance(source, pd.DataFrame):
+                frame = source
+            elif str(source).endswith('.parquet'):
+                frame = pd.read_parquet(source)
+            else:
+                frame = pd.read_csv(source)
+            if not isinstance(frame.index, pd.DatetimeIndex):
+                frame = frame.set_index(pd.to_datetime(frame.pop('time')))
+            self._frames[symbol] = frame
+        return self._frames[symbol]
+
+    def history(self, symbol: str) -> pd.DataFrame:
+        return self._frame(symbol).iloc[:self.history_rows]
+
+    async def stream(self, symbol: str) -> AsyncIterator[pd.DataFrame]:
+        frame = self._frame(symbol)
+        for start in range(self.history_rows, len(frame), self.batch):
+            await asyncio.sleep(self.interval)
+            yield frame.iloc[start:start + self.batch]
+
+
+class _Channel:
+    """
+    One symbol: a single LiveChart computation shared by all its viewers.
+    """
+    def __init__(self, symbol: str, chart: LiveChart):
+        self.symbol = symbol
+        self.chart = chart
+        self.sequence = 0
+        self.backlog: Deque[Tuple[int, str]] = collections.deque(maxlen=UPDATE_BACKLOG)
+        self.clients = set()
+        self.task = None
+        self._page: Tuple[int, str] = None
+
+    def page(self) -> str:
+        """
+        The chart page at the current update. It is rendered once per update and shared by every page load.
+        """
+        if self._page is None or self._page[0] != self.sequence:
+            html = self.chart.show(display='html')
+            client = CLIENT_JS % {'apply_update': APPLY_UPDATE_JS, 'sequence': self.sequence, 'symbol': self.symbol, 'chart_id': self.chart.chart_id}
+            self._page = (self.sequence, html.replace('</body>', client + '</body>'))
+        return self._page[1]
+
+    def publish(self, bars: pd.DataFrame):
+        update = self.chart.payload(bars)
+        if not update['time']:
+            return
+        self.sequence += 1
+        message = spec.dumps({'sequence': self.sequence, 'update': update})
+        self.backlog.append((self.sequence, message))
+        for client in list(self.clients):
+            try:
+                client.write_message(message)
+            except tornado.websocket.WebSocketClosedError:
+                self.clients.discard(client)
+
+
+class ChartServer:
+    def __init__(self, feed: BarFeed, symbols: List[str], overlays: List[IndicatorSpec] = None, subplots: List[IndicatorSpec] = None,
+                 theme: str = 'light', port: int = 8888):
+        """
+        Serve live charts over HTTP and push their updates to every viewer over websockets.
+
+        Each symbol is computed once, whatever the number of viewers: bars from the feed update one LiveChart
+        per symbol and the resulting update payload is broadcast to all its open pages.
+
+        Args:
+            feed (BarFeed): Source of the bars, e.g. ReplayFeed.
+            symbols (List[str]): Symbols to serve, at /chart/<symbol>.
+            overlays (List[IndicatorSpec]): Indicators drawn on the price panel, see LiveChart.
+            subplots (List[IndicatorSpec]): Indicators drawn in their own panel, see LiveChart.
+            theme (str): 'light' or 'dark'. Default is 'light'.
+            port (int): HTTP port. Default is 8888.
+        """
+        self.feed = feed
+        self.port = port
+        self.channels = {
+            symbol: _Channel(symbol, LiveChart(feed.history(symbol), overlays=overlays, subplots=subplots, title=symbol, theme=theme))
+            for symbol in symbols
+        }
+
+    def application(self) -> tornado.web.Application:
+        """
+        Build the Tornado application: / lists the symbols, /chart/<symbol> serves a chart page and /ws/<symbol> its updates.
+        With set_assets('local', js_host='/assets/'), /assets/echarts.min.js serves the local ECharts bundle.
+        """
+        handlers = [
+            (r"/", _IndexHandler, {'server': self}),
+            (r"/chart/([^/]+)", _ChartHandler, {'server': self}),
+            (r"/ws/([^/]+)", _UpdateSocket, {'server': self}),
+        ]
+        if assets.get_assets()['js_host'] == '/assets/':
+            handlers.append((r"/assets/(echarts\.min\.js)", tornado.web.StaticFileHandler, {'path': os.path.dirname(assets.echarts_path())}))
+        return tornado.web.Application(handlers)
+
+    async def _pump(self, channel: _Channel):
+        async for bars in self.feed.stream(channel.symbol):
+            channel.publish(bars)
+
+    def start_feeds(self):
+        """
+        Start consuming the feed of every symbol on the running event loop.
+        """
+        for channel in self.channels.values():
+            if channel.task is None:
+                channel.task = asyncio.ensure_future(self._pump(channel))
+
+    def serve(self):
+        """
+        Listen on the configured port and run until interrupted.
+        """
+        self.application().listen(self.port)
+        loop = tornado.ioloop.IOLoop.current()
+        loop.add_callback(self.start_feeds)
+        loop.start()
+
+
+class _Handler(tornado.web.RequestHandler):
+    def initialize(self, server: ChartServer):
+        self.server = server
+
+    def channel(self, symbol: str) -> _Channel:
+        if symbol not in self.server.channels:
+            raise tornado.web.HTTPError(404, f"Unknown symbol: {symbol}")
+        return self.server.channels[symbol]
+
+
+class _IndexHandler(_Handler):
+    def get(self):
+        links = ''.join(f'<li><a href="/chart/{symbol}">{symbol}</a></li>' for symbol in self.server.channels)
+        self.write(f"<html><body><ul>{links}</ul></body></html>")
+
+
+class _ChartHandler(_Handler):
+    def get(self, symbol: str):
+        self.write(self.channel(symbol).page())
+
+
+class _UpdateSocket(tornado.websocket.WebSocketHandler):
+    def initialize(self, server: ChartServer):
+        self.server = server
+        self.subscribed = None
+        self.since = 0
+
+    def prepare(self):
+        # Checked before the WebSocket handshake, so a bad request gets a 400 response.
+        try:
+            self.since = int(self.get_argument('since', '0'))
+        except ValueError:
+            raise tornado.web.HTTPError(400, reason="'since' must be an integer update number")
+
+    def open(self, symbol: str):
+        if symbol not in self.server.channels:
+            self.close(code=4004, reason=f"Unknown symbol: {symbol}")
+            return
+        channel = self.server.channels[symbol]
+        since = self.since
+        if channel.backlog and since < channel.backlog[0][0] - 1:
+            # The page missed more updates than the backlog holds: it has to be loaded again.
+            self.write_message(spec.dumps({'reload': True}))
+        for sequence, message in channel.backlog:
+            if sequence > since:
+                self.write_message(message)
+        channel.clients.add(self)
+        self.subscribed = channel
+
+    def on_close(self):
+        if self.subscribed is not None:
+            self.subscribed.clients.discard(self)
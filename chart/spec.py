@@ -0,0 +1,235 @@
+import re
+import json
+import datetime
+import numpy as np
+from numbers import Number
+from typing import Any, Dict, List
+from pyecharts.options.series_options import BasicOpts
+from pyecharts.commons.utils import JsCode
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Decimal places kept for chart values, matching the .round(2) applied to indicator data.
+DEFAULT_PRECISION = 2
+
+_JS_MARKER = "--x_x--0_0--"
+
+
+def chart_spec(chart: Any, precision: int = DEFAULT_PRECISION, dataset: bool = False) -> Dict[str, Any]:
+    """
+    Convert a pyecharts chart to a compact ECharts option dict, ready for a web front end.
+
+    Compared to the options pyecharts renders:
+        - empty options are dropped, numeric data is rounded with NumPy and NaN becomes null;
+        - per-item colors (e.g. volume bars colored by candle direction) are dictionary-encoded:
+          items become [index, value, color code] and one piecewise visualMap maps the codes to colors;
+        - JavaScript functions (JsCode) are kept as their source string, to be revived by the front end.
+
+    Args:
+        chart: A pyecharts chart or Grid.
+        precision (int): Decimal places of numeric data. Default is DEFAULT_PRECISION.
+        dataset (bool): Share one dataset between the series, see share_dataset. Default is False.
+
+    Returns:
+        Dict[str, Any]: The ECharts option.
+    """
+    spec = _plain(chart.get_options(), precision)
+    if dataset:
+        share_dataset(spec)
+    for index, series in enumerate(spec.get('series', [])):
+        _encode_item_colors(spec, index, series)
+    return spec
+
+
+def dumps(spec: Dict[str, Any]) -> str:
+    """
+    Serialize a chart spec to compact JSON, with orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(spec).decode()
+    return json.dumps(spec, separators=(',', ':'), allow_nan=False, ensure_ascii=False)
+
+
+def _plain(value: Any, precision: int) -> Any:
+    if isinstance(value, BasicOpts):
+        value = value.opts
+    if isinstance(value, dict):
+        return {key: _plain(item, precision) for key, item in value.items() if item is not None and item != ''}
+    if isinstance(value, (list, tuple)):
+        if value and all(_is_numeric(item) or item is None for item in value):
+            return round_values(value, precision)
+        return [_plain(item, precision) for item in value]
+    if isinstance(value, JsCode):
+        return _js_source(value)
+    if isinstance(value, float):
+        if value != value or value in (float('inf'), float('-inf')):
+            return None
+        value = round(value, precision)
+        return int(value) if value.is_integer() else value
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return _plain(value.item(), precision)
+    return value
+
+
+def _is_numeric(value: Any) -> bool:
+    """
+    Whether a value is a number to round. Booleans (e.g. signal flags) are kept as they are.
+    """
+    return isinstance(value, Number) and not isinstance(value, (bool, np.bool_))
+
+
+def _js_source(code: JsCode) -> str:
+    source = re.sub("\\n|\\t", "", code.js_code).replace(r"\n", "\n").replace(r"\t", "\t")
+    return source.replace(_JS_MARKER, "")
+
+
+def round_values(values: List[Any], precision: int = DEFAULT_PRECISION) -> List[Any]:
+    """
+    Round a list of numbers in one NumPy pass. NaN and None become None and whole numbers are
+    written as integers, which keeps large series (e.g. volume) short once serialized. Boolean
+    series are returned unchanged.
+    """
+    if np.asarray(values).dtype == bool:
+        return np.asarray(values).tolist()
+    array = np.round(np.asarray(values, dtype=float), precision)
+    result = array.astype(object)
+    result[~np.isfinite(array)] = None
+    whole = np.isfinite(array) & (array == np.trunc(array))
+    result[whole] = array[whole].astype(np.int64).tolist()
+    return result.tolist()
+
+
+def _item_colors(data: List[Any]):
+    """
+    Split {value, itemStyle: {color}} items into values, color codes and the palette of codes, or None for other data.
+    """
+    if not data or not all(isinstance(item, dict) and set(item) == {'value', 'itemStyle'} and set(_options_of(item['itemStyle'])) == {'color'} for item in data):
+        return None
+    colors = [_options_of(item['itemStyle'])['color'] for item in data]
+    palette = list(dict.fromkeys(colors))
+    codes = {color: code for code, color in enumerate(palette)}
+    return [item['value'] for item in data], [codes[color] for color in colors], palette
+
+
+def _color_visual_map(series_index: int, dimension: int, palette: List[str]) -> Dict[str, Any]:
+    return {
+        'show': False,
+        'type': 'piecewise',
+        'seriesIndex': series_index,
+        'dimension': dimension,
+        'pieces': [{'value': code, 'color': color} for code, color in enumerate(palette)],
+    }
+
+
+def _add_visual_map(options: Dict[str, Any], visual_map: Dict[str, Any]):
+    visual_maps = _as_list(options.get('visualMap'))
+    options['visualMap'] = visual_maps + [visual_map]
+
+
+def _encode_item_colors(spec: Dict[str, Any], index: int, series: Dict[str, Any]):
+    encoded = _item_colors(series.get('data'))
+    if encoded is None:
+        return
+    values, codes, palette = encoded
+    series['data'] = [[position, value, code] for position, (value, code) in enumerate(zip(round_values(values), codes))]
+    series['encode'] = {'x': 0, 'y': 1}
+    _add_visual_map(spec, _color_visual_map(index, 2, palette))
+
+def share_dataset(options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Move the data of the series into one shared ECharts `dataset`, modifying `options` in place.
+
+    The time axis and every line, candlestick, bar and scatter series aligned with it become columns
+    of a single `dataset.source` table and the series read them through `encode`. Per-item bar colors
+    (volume) become a code column mapped back to colors by a visualMap. Category axes whose series all
+    moved drop their own copy of the time labels. Series targeted by an existing visualMap (whose
+    `dimension` refers to the series data) keep their inline data.
+
+    Args:
+        options (Dict[str, Any]): ECharts option, as pyecharts options or a chart spec.
+
+    Returns:
+        Dict[str, Any]: The same options.
+    """
+    x_axes = [_options_of(axis) for axis in _as_list(options.get('xAxis'))]
+    series_list = options.get('series') or []
+    targeted = _visual_map_targets(options, len(series_list))
+    time = None
+    columns = {}
+    inline_axes = set()
+    for index, series in enumerate(series_list):
+        axis_index = series.get('xAxisIndex') or 0
+        categories = x_axes[axis_index].get('data') if axis_index < len(x_axes) else None
+        series_columns = None
+        if index not in targeted and categories and (time is None or categories == time):
+            series_columns = _series_columns(series, categories)
+        if series_columns is None:
+            inline_axes.add(axis_index)
+            continue
+        time = categories
+        palette = series_columns.pop('palette', None)
+        names = [f"{index}:{suffix}" if suffix else str(index) for suffix in series_columns]
+        columns.update(zip(names, series_columns.values()))
+        series.pop('data')
+        series['datasetIndex'] = 0
+        if palette is None:
+            series['encode'] = {'x': 'time', 'y': names if len(names) > 1 else names[0]}
+        else:
+            # Per-item colors become a code column, mapped back to colors by a visualMap on its dataset dimension.
+            series['encode'] = {'x': 'time', 'y': names[0]}
+            _add_visual_map(options, _color_visual_map(index, list(columns).index(names[1]) + 1, palette))
+
+    if columns:
+        options['dataset'] = {'source': {'time': time, **columns}}
+        for axis_index, axis in enumerate(x_axes):
+            if axis_index not in inline_axes and axis.get('data') == time:
+                axis.pop('data')
+    return options
+
+
+def _series_columns(series: Dict[str, Any], categories: List[Any]) -> Dict[str, List[Any]]:
+    data = series.get('data')
+    if series.get('type') not in ('line', 'bar', 'scatter', 'candlestick') or not data or len(data) != len(categories):
+        return None
+    first, last = data[0], data[-1]
+    if series['type'] == 'candlestick':
+        if not all(isinstance(item, (list, tuple)) and len(item) == 4 for item in (first, last)):
+            return None
+        return dict(zip(['open', 'close', 'low', 'high'], (list(column) for column in zip(*data))))
+    encoded = _item_colors(data) if series['type'] == 'bar' else None
+    if encoded is not None:
+        values, codes, palette = encoded
+        return {'': values, 'color': codes, 'palette': palette}
+    if isinstance(first, (list, tuple)):
+        # pyecharts stores line and scatter points as [x, y] pairs.
+        if first[0] != categories[0] or last[0] != categories[-1]:
+            return None
+        return {'': [item[1] for item in data]}
+    if all(isinstance(item, Number) or item is None for item in (first, last)):
+        return {'': list(data)}
+    return None
+
+
+def _visual_map_targets(options: Dict[str, Any], n_series: int) -> set:
+    targets = set()
+    for visual_map in _as_list(options.get('visualMap')):
+        series_index = _options_of(visual_map).get('seriesIndex')
+        if series_index is None:
+            return set(range(n_series))
+        targets.update(series_index if isinstance(series_index, list) else [series_index])
+    return targets
+
+
+def _options_of(value: Any) -> Dict[str, Any]:
+    return value.opts if isinstance(value, BasicOpts) else value
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
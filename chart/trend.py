@@ -1,14 +1,15 @@
 import pandas as pd
 from pyecharts import options as opts
 from vnstock_ta.utils.const import _ISLAND_GREEN, _ORANGE, _TURKISH_SEA, _SLATE_BLUE, _GRADIENT_EMERALD, NEUTRAL_INFORMATION_COMPLETE, DARK_MODE_PRIMARY_COLORS, DARK_MODE_SECONDARY_COLORS, LIGHT_MODE_PRIMARY_COLORS, LIGHT_MODE_SECONDARY_COLORS
-from vnstock_ta.chart.core import TAChart
+from vnstock_ta.chart.core import TAChart, ChartContext
 
 
 # extend the TAChart class
 
 class TATrend(TAChart):
-    def __init__(self, data: pd.DataFrame, theme: str = 'light', watermark: bool = True, display: bool = True):
-        super().__init__(data, theme, watermark, display)
+    def __init__(self, data: pd.DataFrame, theme: str = 'light', watermark: bool = True, display: bool = True, context: ChartContext = None,
+                 max_points: int = None, shared_dataset: bool = False):
+        super().__init__(data, theme, watermark, display, context, max_points, shared_dataset)
 
     def sma (self, length:int=10, title:str='Simple Moving Average', color=_ORANGE,
             legend=True, watermark=True, minimal:bool=False):
@@ -32,7 +33,7 @@ class TATrend(TAChart):
         else:
             color_list = list(LIGHT_MODE_PRIMARY_COLORS.values()) + list(LIGHT_MODE_SECONDARY_COLORS.values())
 
-        time_index = self.data.index.strftime('%Y-%m-%d').tolist()
+        time_index = self.chart._time_index()
         
         # check if length is a list
         if isinstance(length, list):
@@ -74,7 +75,7 @@ class TATrend(TAChart):
         else:
             color_list = list(LIGHT_MODE_PRIMARY_COLORS.values()) + list(LIGHT_MODE_SECONDARY_COLORS.values())
 
-        time_index = self.data.index.strftime('%Y-%m-%d').tolist()
+        time_index = self.chart._time_index()
         
         # check if length is a list
         if isinstance(length, list):
@@ -116,7 +117,7 @@ class TATrend(TAChart):
         else:
             color_list = list(LIGHT_MODE_PRIMARY_COLORS.values()) + list(LIGHT_MODE_SECONDARY_COLORS.values())
 
-        time_index = self.data.index.strftime('%Y-%m-%d').tolist()
+        time_index = self.chart._time_index()
 
         if isinstance(anchor, list):
             indicator_data = self.ta.vwap(anchor=anchor[0]).round(2)
@@ -157,7 +158,7 @@ class TATrend(TAChart):
         else:
             color_list = list(LIGHT_MODE_PRIMARY_COLORS.values()) + list(LIGHT_MODE_SECONDARY_COLORS.values())
 
-        time_index = self.data.index.strftime('%Y-%m-%d').tolist()
+        time_index = self.chart._time_index()
         
         # check if length is a list
         if isinstance(length, list):
@@ -194,7 +195,7 @@ class TATrend(TAChart):
         indicator_data = self.ta.psar(af0=af0, af=af, max_af=max_af).round(2)
         # create psa_series by fillna the first column in indicator_data with the second column
         psar_series = indicator_data.iloc[:, 0].fillna(indicator_data.iloc[:, 1])
-        time_index = self.data.index.strftime('%Y-%m-%d').tolist()
+        time_index = self.chart._time_index()
         indicator_scatter = self.chart._scatter(time_series=time_index, data_series=psar_series, color=indicator_color, symbol_size=symbol_size, title=title, yaxis_name='PSAR', legend=legend, watermark=watermark)
         
         if minimal:
@@ -223,7 +224,7 @@ class TATrend(TAChart):
             indicator_color = self.chart.mono_color
 
         indicator_data = self.ta.supertrend(length=length, multiplier=multiplier).round(2)
-        time_index = self.data.index.strftime('%Y-%m-%d').tolist()
+        time_index = self.chart._time_index()
         indicator_line = self.chart._line(time_series=time_index, data_series=indicator_data.iloc[:, -2], color=indicator_color[0], title=title, yaxis_name='Up Trend', legend=legend, watermark=watermark)
         indicator_line = self.chart._add_line(line_chart=indicator_line, data_series=indicator_data.iloc[:, -1], color=indicator_color[1], title=title, yaxis_name='Down Trend')
 
@@ -241,7 +242,7 @@ class TATrend(TAChart):
             indicator_color = self.chart.mono_color
 
         indicator_data = self.ta.adx(length=length).round(2).iloc[:, 0]
-        time_index = self.data.index.strftime('%Y-%m-%d').tolist()
+        time_index = self.chart._time_index()
         markline = opts.MarkLineOpts(data=[opts.MarkLineItem(y=25, name="Có xu hướng", 
                                                              linestyle_opts=opts.LineStyleOpts(width=1, color=_ISLAND_GREEN, opacity=0.5, type_='dashed'))],
                                                              label_opts=opts.LabelOpts(is_show=False)) # , opts.MarkLineItem(y=30, name="Quá bán")
@@ -263,7 +264,7 @@ class TATrend(TAChart):
         indicator_data = self.ta.aroon(length=length).round(2)
         aroon_up = indicator_data.iloc[:, 1]
         aroon_down = indicator_data.iloc[:, 0]
-        time_index = self.data.index.strftime('%Y-%m-%d').tolist()
+        time_index = self.chart._time_index()
         indicator_line = self.chart._line(time_series=time_index, data_series=aroon_up, color=indicator_color[0], title=title, yaxis_name='Aroon Up', is_smooth=False, legend=legend, watermark=watermark, show_xaxis=False)
         indicator_line = self.chart._add_line(line_chart=indicator_line, data_series=aroon_down, color=indicator_color[1], title=title, yaxis_name='Aroon Down', is_smooth=False)
 
@@ -0,0 +1,279 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, List, Tuple, Union
+from pyecharts.commons.utils import JsCode
+from vnstock_ta.chart.core import BaseChart
+from vnstock_ta.chart.live import IndicatorSpec, _parse_indicator
+from vnstock_ta.chart import downsample, spec
+from vnstock_ta.indicators.kernels import WIDE_KERNELS
+
+UNIVERSE_KINDS = ['line', 'candle']
+
+# Values at the two ends of the heatmap color scale. Indicators without a fixed scale use a range symmetric
+# around 0 that covers 95% of the values shown, or the range of 95% of them when they all have the same sign.
+HEATMAP_RANGES = {'rsi': (20, 80)}
+
+
+class UniverseChart:
+    def __init__(self, data: Dict[str, pd.DataFrame], indicator: IndicatorSpec = None, overlay: bool = True, kind: str = 'line',
+                 columns: int = 6, max_points: int = 120, title: str = 'Market Overview', theme: str = 'light',
+                 cell_height: int = 160, width: str = None):
+        """
+        Small multiples of many symbols on one page: a sparkline or mini-candle chart per symbol, all drawn
+        by a single ECharts instance from one shared dataset.
+
+        The symbols are aligned on the union of their timestamps and downsampled with one shared bucket layout,
+        so every cell has the same time labels and the page holds them once: candles are aggregated per bucket
+        and lines keep their shape with LTTB.
+
+        Args:
+            data (Dict[str, pd.DataFrame]): OHLCV data per symbol, in display order.
+            indicator (IndicatorSpec): Indicator of each cell, as an Indicator method name ('sma') or a (name, params)
+                pair (('bbands', {'length': 20})). Default is None (price only).
+            overlay (bool): Draw the indicator over the price (moving averages, bands). False draws the indicator
+                instead of the price, for oscillators such as RSI. Default is True.
+            kind (str): 'line' (close sparkline colored by the change over the period) or 'candle'. Default is 'line'.
+            columns (int): Number of cells per row. Default is 6.
+            max_points (int): Maximum number of points per cell. Default is 120.
+            title (str): Title of the page.
+            theme (str): 'light' or 'dark'. Default is 'light'.
+            cell_height (int): Height of a row in pixels. Default is 160.
+            width (str): Width of the page. Default is None (1500px).
+        """
+        if kind not in UNIVERSE_KINDS:
+            raise ValueError(f"Unknown kind: {kind}. Valid kinds are {UNIVERSE_KINDS}")
+        if not data:
+            raise ValueError("data must hold at least one symbol")
+        self.indicator = _parse_indicator(indicator) if indicator is not None else None
+        self.overlay = overlay
+        self.kind = kind
+        self.columns = columns
+        self.title = title
+        self.cell_height = cell_height
+        self.width = width
+
+        index = data[next(iter(data))].index
+        for frame in data.values():
+            index = index.union(frame.index)
+        self.index = index
+        self.frames = data
+        self.data = {symbol: self._align(frame) for symbol, frame in data.items()}
+        # The chart data only carries the common time index: it drives the shared time labels and bucket layout.
+        self.chart = BaseChart(candle_data=pd.DataFrame(index=index), theme=theme, max_points=max_points, shared_dataset=True)
+
+    def _align(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Reindex a symbol on the common time index. Missing bars after its first one repeat the last close.
+        These filler bars are only drawn: indicators are computed on the symbol's own bars.
+        """
+        aligned = frame[['open', 'high', 'low', 'close', 'volume']].reindex(self.index)
+        close = aligned['close'].ffill()
+        missing = aligned['close'].isna()
+        aligned.loc[missing, ['open', 'high', 'low']] = np.repeat(close[missing].to_numpy()[:, None], 3, axis=1)
+        aligned['close'] = close
+        return aligned
+
+    def build(self) -> Any:
+        """
+        Build the page: one cell per symbol, titled with the symbol and its change over the period.
+        """
+        chart = self.chart
+        time_index = chart._time_index()
+        cells = []
+        for symbol, frame in self.data.items():
+            close = frame['close'].dropna()
+            change = (close.iloc[-1] / close.iloc[0] - 1) * 100 if len(close) else 0.0
+            cells.append((f"{symbol} {change:+.1f}%", self._cell(time_index, symbol, frame, change)))
+        return chart._multiples_layout(cells, title=self.title, columns=self.columns, cell_height=self.cell_height, chart_width=self.width)
+
+    def show(self, display: Union[bool, str] = True) -> Any:
+        """
+        Render the page, see BaseChart._render.
+        """
+        return self.chart._render(self.build(), display=display)
+
+    def _cell(self, time_index: List[str], symbol: str, frame: pd.DataFrame, change: float) -> Any:
+        chart = self.chart
+        columns = self._indicator_columns(symbol) if self.indicator is not None else []
+        if columns and not self.overlay:
+            return self._lines(time_index, symbol, columns)
+        if self.kind == 'candle':
+            layer = chart._kline(time_series=time_index, ohlc_data=self._ohlc(frame), title=symbol, yaxis_name=symbol, tools=False)
+        else:
+            color = chart.bull_color if change >= 0 else chart.bear_color
+            layer = chart._line(time_series=time_index, data_series=frame['close'].tolist(), title=symbol, yaxis_name=symbol,
+                                color=color, is_smooth=False, zoomable=False, tools=False, show_xaxis=False, theme=chart.theme)
+        if columns:
+            layer = layer.overlap(self._lines(time_index, symbol, columns))
+        return layer
+
+    def _ohlc(self, frame: pd.DataFrame) -> List[List[float]]:
+        """
+        Candles of a symbol in ECharts order (open, close, low, high), aggregated with the shared bucket layout.
+        """
+        open_, high, low, close = (frame[column].to_numpy(dtype=float) for column in ('open', 'high', 'low', 'close'))
+        edges = self.chart._lod_edges()
+        if edges is not None:
+            open_, high, low, close = downsample.aggregate_ohlc(open_, high, low, close, edges)
+        return np.column_stack([open_, close, low, high]).tolist()
+
+    def _indicator_columns(self, symbol: str) -> List[Tuple[str, np.ndarray]]:
+        """
+        Indicator of a symbol computed on its own bars, then aligned on the common time index.
+        """
+        from vnstock_ta.interface import Indicator
+        name, params = self.indicator
+        result = getattr(Indicator(self.frames[symbol].sort_index().dropna(subset=['close'])), name)(**params)
+        if result is None:
+            return []
+        if isinstance(result, pd.Series):
+            result = result.to_frame()
+        result = pd.DataFrame(result).reindex(self.index)
+        return [(str(column), result[column].to_numpy(dtype=float)) for column in result.columns]
+
+    def _lines(self, time_index: List[str], symbol: str, columns: List[Tuple[str, np.ndarray]]) -> Any:
+        chart = self.chart
+        palette = [chart.indicator_color, chart.indicator_1_color, chart.indicator_2_color, chart.indicator_3_color,
+                   chart.indicator_4_color, chart.indicator_5_color]
+        return chart._multi_lines(time_series=time_index, series_list=[values.tolist() for _, values in columns],
+                                  color_list=[palette[i % len(palette)] for i in range(len(columns))],
+                                  title_list=[f"{symbol} {column}" for column, _ in columns], yaxis_name=symbol, zoomable=False)
+
+
+class UniverseHeatmap:
+    def __init__(self, data: Union[Dict[str, pd.DataFrame], pd.DataFrame], indicator: str = 'rsi', length: int = None,
+                 sectors: Dict[str, str] = None, periods: int = 60, title: str = None, theme: str = 'light',
+                 width: str = None, height: str = None):
+        """
+        Heatmap of one indicator across a whole universe: symbol x date, or sector x symbol with `sectors`.
+
+        'rsi', 'roc' and 'sma_distance' are computed for all symbols at once on a wide close frame (one column per
+        symbol); symbols with missing bars inside their history are computed on their own bars, so lookbacks never
+        span the gaps of the common time index. Any other Indicator method is computed symbol by symbol. The cells
+        are sent as compact [x index, y index, value] items, missing values left out.
+
+        Args:
+            data (Union[Dict[str, pd.DataFrame], pd.DataFrame]): OHLCV data per symbol, or a wide frame of closes
+                (enough for indicators of the close only).
+            indicator (str): 'rsi', 'roc', 'sma_distance' (percent distance from the SMA) or another Indicator method
+                name, e.g. 'cmo' or 'adx'; the first column of multi-column results is shown. Default is 'rsi'.
+            length (int): Indicator length. Default is None (the indicator's default: 14 for RSI, 9 for ROC,
+                200 for the SMA distance).
+            sectors (Dict[str, str]): Sector of each symbol. Given, the heatmap shows the latest value of every symbol
+                in one row per sector; symbols without a sector go to 'Other'. Default is None (symbol x date).
+            periods (int): Number of most recent bars of the symbol x date heatmap. Default is 60.
+            title (str): Title of the chart. Default is None (the indicator name).
+            theme (str): 'light' or 'dark'. Default is 'light'.
+            width (str): Width of the chart. Default is None (1500px).
+            height (str): Height of the chart. Default is None (fitted to the number of rows).
+        """
+        from vnstock_ta.interface import Indicator
+        inputs = getattr(getattr(Indicator, indicator, None), 'inputs', None)
+        if indicator not in WIDE_KERNELS and inputs is None:
+            raise ValueError(f"Unknown indicator: {indicator}. Valid indicators are {list(WIDE_KERNELS)} or an Indicator method")
+        if isinstance(data, dict):
+            self.frames = {symbol: frame.sort_index() for symbol, frame in data.items()}
+            data = pd.DataFrame({symbol: frame['close'] for symbol, frame in self.frames.items()})
+        else:
+            self.frames = {symbol: data[symbol].dropna().sort_index().to_frame('close') for symbol in data.columns}
+        for symbol, frame in self.frames.items():
+            missing = [column for column in inputs or () if column not in frame.columns]
+            if missing:
+                raise ValueError(f"{indicator} needs the {missing} columns, which the data of {symbol} does not have")
+        self.close = data.sort_index()
+        self.indicator = indicator
+        self.length = length
+        self.sectors = sectors
+        self.periods = periods
+        self.title = title or (indicator.upper() if length is None else f"{indicator.upper()} {length}")
+        self.width = width
+        self.height = height
+        self.chart = BaseChart(candle_data=pd.DataFrame(index=self.close.index), theme=theme)
+        self._values = None
+
+    def values(self) -> pd.DataFrame:
+        """
+        Indicator values of the whole universe, one column per symbol, computed once.
+        """
+        if self._values is None:
+            params = {} if self.length is None else {'length': self.length}
+            if self.indicator in WIDE_KERNELS:
+                self._values = self._wide_values(WIDE_KERNELS[self.indicator], params)
+            else:
+                self._values = self._symbol_values(params)
+        return self._values
+
+    def _wide_values(self, kernel: Callable[..., pd.DataFrame], params: Dict[str, Any]) -> pd.DataFrame:
+        close = self.close
+        valid = close.notna()
+        # Symbols missing bars between their first and last one would shift and roll over the empty rows of the
+        # common index: they are computed on their own bars and aligned back.
+        ragged = ((valid.cummax() & valid[::-1].cummax()[::-1]) & ~valid).any()
+        values = kernel(close.loc[:, ~ragged], **params)
+        for symbol in close.columns[ragged]:
+            values[symbol] = kernel(close[[symbol]].dropna(), **params)[symbol]
+        return values[close.columns]
+
+    def _symbol_values(self, params: Dict[str, Any]) -> pd.DataFrame:
+        from vnstock_ta.interface import Indicator
+        columns = {}
+        for symbol, frame in self.frames.items():
+            result = getattr(Indicator(frame.dropna(subset=['close'])), self.indicator)(**params)
+            if isinstance(result, pd.DataFrame):
+                result = result.iloc[:, 0]
+            columns[symbol] = result if result is not None else pd.Series(np.nan, index=frame.index)
+        return pd.DataFrame(columns).reindex(self.close.index)
+
+    def build(self) -> Any:
+        """
+        Build the heatmap chart.
+        """
+        if self.sectors is None:
+            x_labels, y_labels, cells = self._by_date()
+            label, formatter = False, None
+        else:
+            x_labels, y_labels, cells = self._by_sector()
+            label, formatter = True, JsCode("function (params) { return params.data[3] + '\\n' + params.data[2]; }")
+        return self.chart._heatmap(x_labels, y_labels, cells, title=self.title, series_name=self.title,
+                                   value_range=self._value_range([cell[2] for cell in cells]), label=label,
+                                   zoomable=self.sectors is None, chart_width=self.width,
+                                   chart_height=self.height or f"{max(400, 160 + (40 if self.sectors else 18) * len(y_labels))}px",
+                                   label_formatter=formatter)
+
+    def show(self, display: Union[bool, str] = True) -> Any:
+        """
+        Render the heatmap, see BaseChart._render.
+        """
+        return self.chart._render(self.build(), display=display)
+
+    def _by_date(self) -> Tuple[List[str], List[str], List[List[Any]]]:
+        values = self.values().iloc[-self.periods:]
+        array = values.to_numpy(dtype=float)
+        dates, symbols = np.nonzero(np.isfinite(array))
+        cells = [list(cell) for cell in zip(dates.tolist(), symbols.tolist(), spec.round_values(array[dates, symbols]))]
+        return values.index.strftime(self.chart._time_format()).to_list(), [str(symbol) for symbol in values.columns], cells
+
+    def _by_sector(self) -> Tuple[List[str], List[str], List[List[Any]]]:
+        latest = self.values().ffill().iloc[-1].dropna()
+        groups = pd.DataFrame({'value': latest, 'sector': [self.sectors.get(symbol, 'Other') for symbol in latest.index]})
+        groups = groups.sort_values('value', ascending=False)
+        y_labels = list(dict.fromkeys(self.sectors.get(symbol, 'Other') for symbol in self.close.columns if symbol in latest.index))
+        cells = []
+        for row, sector in enumerate(y_labels):
+            members = groups[groups['sector'] == sector]
+            rounded = spec.round_values(members['value'].to_numpy())
+            cells.extend([position, row, value, str(symbol)] for position, (symbol, value) in enumerate(zip(members.index, rounded)))
+        width = max((cell[0] for cell in cells), default=0) + 1
+        return [str(position + 1) for position in range(width)], y_labels, cells
+
+    def _value_range(self, values: List[float]) -> Tuple[float, float]:
+        if self.indicator in HEATMAP_RANGES:
+            return HEATMAP_RANGES[self.indicator]
+        if not values:
+            return -1.0, 1.0
+        low, high = np.nanpercentile(values, [2.5, 97.5])
+        if (low >= 0 or high <= 0) and high > low:
+            # One-signed values (e.g. price levels) span the range of 95% of them.
+            return round(float(low), 2), round(float(high), 2)
+        bound = round(float(np.nanpercentile(np.abs(values), 95)), 2) or 1.0
+        return -bound, bound
@@ -1,14 +1,15 @@
 import pandas as pd
 from pyecharts import options as opts
 from vnstock_ta.utils.const import _ISLAND_GREEN, _ORANGE, _TURKISH_SEA, _SLATE_BLUE, _LIME_PUNCH, _GRADIENT_EMERALD, NEUTRAL_INFORMATION_COMPLETE, DARK_MODE_PRIMARY_COLORS, DARK_MODE_SECONDARY_COLORS, LIGHT_MODE_PRIMARY_COLORS, LIGHT_MODE_SECONDARY_COLORS
-from vnstock_ta.chart.core import TAChart
+from vnstock_ta.chart.core import TAChart, ChartContext
 
 
 # extend the TAChart class
 
 class TAVolatility(TAChart):
-    def __init__(self, data: pd.DataFrame, theme: str = 'light', watermark: bool = True, display: bool = True):
-        super().__init__(data, theme, watermark, display)
+    def __init__(self, data: pd.DataFrame, theme: str = 'light', watermark: bool = True, display: bool = True, context: ChartContext = None,
+                 max_points: int = None, shared_dataset: bool = False):
+        super().__init__(data, theme, watermark, display, context, max_points, shared_dataset)
 
     def bbands (self, length:int=10, std:int=2, title:str='Bollinger Bands', color=[_TURKISH_SEA, _ORANGE],
             legend=True, watermark=True, minimal:bool=False):
@@ -28,7 +29,7 @@ class TAVolatility(TAChart):
         mid_band = indicator_data.iloc[:, 1]
         upper_band = indicator_data.iloc[:, 2]
 
-        time_index = self.data.index.strftime('%Y-%m-%d').tolist()
+        time_index = self.chart._time_index()
         band_line = self.chart._line(time_series=time_index, data_series=upper_band, color=envelope_color, area_style=False, title=title, yaxis_name='Up Band', legend=legend, watermark=watermark)
         band_line = self.chart._add_line(line_chart=band_line, data_series=lower_band, color=envelope_color, title=title, yaxis_name='Low Band')
         mid_line = self.chart._add_line(line_chart=band_line, data_series=mid_band, color=midband_color, title=title, yaxis_name='Mid Band')
@@ -56,7 +57,7 @@ class TAVolatility(TAChart):
         mid_band = indicator_data.iloc[:, 1]
         upper_band = indicator_data.iloc[:, 2]
 
-        time_index = self.data.index.strftime('%Y-%m-%d').tolist()
+        time_index = self.chart._time_index()
         band_line = self.chart._line(time_series=time_index, data_series=upper_band, color=envelope_color, area_style=False, title=title, yaxis_name='Up', legend=legend, watermark=watermark)
         band_line = self.chart._add_line(line_chart=band_line, data_series=lower_band, color=envelope_color, title=title, yaxis_name='Low')
         mid_line = self.chart._add_line(line_chart=band_line, data_series=mid_band, color=midband_color, title=title, yaxis_name='Mid')
@@ -74,7 +75,7 @@ class TAVolatility(TAChart):
             indicator_color = self.chart.mono_color
 
         indicator_data = self.ta.atr(length=length).round(2)
-        time_index = self.data.index.strftime('%Y-%m-%d').tolist()     
+        time_index = self.chart._time_index()     
         indicator_line = self.chart._line(time_series=time_index, data_series=indicator_data, color=indicator_color, title=title, yaxis_name='ATR', is_smooth=False,
                                           legend=legend, watermark=watermark, show_xaxis=False)
 
@@ -91,7 +92,7 @@ class TAVolatility(TAChart):
             indicator_color = self.chart.mono_color
 
         indicator_data = self.ta.stdev(length=length, ddof=ddof).round(2)
-        time_index = self.data.index.strftime('%Y-%m-%d').tolist()     
+        time_index = self.chart._time_index()     
         indicator_line = self.chart._line(time_series=time_index, data_series=indicator_data, color=indicator_color, title=title, yaxis_name='STDEV', is_smooth=False,
                                           legend=legend, watermark=watermark, show_xaxis=False)
 
@@ -123,7 +124,7 @@ class TAVolatility(TAChart):
         else:
             color_list = list(LIGHT_MODE_PRIMARY_COLORS.values()) + list(LIGHT_MODE_SECONDARY_COLORS.values())
 
-        time_index = self.data.index.strftime('%Y-%m-%d').tolist()
+        time_index = self.chart._time_index()
         
         indicator_data = self.ta.sma(length=length).round(2)
         indicator_line = self.chart._line(time_series=time_index, data_series=indicator_data, color=_ORANGE, title=title, yaxis_name='LR', legend=legend, watermark=watermark)
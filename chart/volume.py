@@ -1,11 +1,12 @@
 import pandas as pd
 from pyecharts import options as opts
 from vnstock_ta.utils.const import _ISLAND_GREEN, _ORANGE, _TURKISH_SEA, _SLATE_BLUE, _LIME_PUNCH, _GRADIENT_EMERALD, NEUTRAL_INFORMATION_COMPLETE, DARK_MODE_PRIMARY_COLORS, DARK_MODE_SECONDARY_COLORS, LIGHT_MODE_PRIMARY_COLORS, LIGHT_MODE_SECONDARY_COLORS
-from vnstock_ta.chart.core import TAChart
+from vnstock_ta.chart.core import TAChart, ChartContext
 
 class TAVolume(TAChart):
-    def __init__(self, data: pd.DataFrame, theme: str = 'light', watermark: bool = True, display: bool = True):
-        super().__init__(data, theme, watermark, display)
+    def __init__(self, data: pd.DataFrame, theme: str = 'light', watermark: bool = True, display: bool = True, context: ChartContext = None,
+                 max_points: int = None, shared_dataset: bool = False):
+        super().__init__(data, theme, watermark, display, context, max_points, shared_dataset)
 
     def obv (self, title='On-Balance Volume', color=_ISLAND_GREEN, 
                     legend=False, watermark=True, minimal:bool=False):
@@ -16,7 +17,7 @@ class TAVolume(TAChart):
             indicator_color = self.chart.mono_color
 
         indicator_data = self.ta.obv().round(2)
-        time_index = self.data.index.strftime('%Y-%m-%d').tolist()
+        time_index = self.chart._time_index()
         
         indicator_line = self.chart._line(time_series=time_index, data_series=indicator_data, color=indicator_color, title=title, yaxis_name='OBV', is_smooth=False,
                                           legend=legend, watermark=watermark, show_xaxis=False)
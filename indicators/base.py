@@ -0,0 +1,179 @@
+import math
+import hashlib
+import inspect
+import functools
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+OUTPUT_TYPES = ['pandas', 'numpy', 'arrow']
+
+# Weight left on the discarded history of a recursive average before its values count as converged.
+CONVERGENCE_TOL = 1e-6
+
+
+def data_version(data: pd.DataFrame) -> Tuple[Tuple[int, int], bytes]:
+    """
+    Fingerprint of a price frame's content: its shape and a digest of its index, columns and values.
+    Changes whenever the frame does, including edits made in place (e.g. df['close'] = ...).
+    """
+    hashed = pd.util.hash_pandas_object(data, index=True).to_numpy()
+    digest = hashlib.blake2b(hashed.tobytes(), digest_size=16)
+    digest.update(repr(list(data.columns)).encode())
+    return data.shape, digest.digest()
+
+
+def convert_output(result: Any, index: pd.Index, output: str = 'pandas', tail: int = None) -> Any:
+    """
+    Convert an indicator result to the requested output type, keeping only the last `tail` rows.
+
+    Args:
+        result: A pandas Series/DataFrame, or a dict of column name to NumPy array as returned by the kernels.
+        index (pd.Index): The time index the result is aligned with.
+        output (str): 'pandas', 'numpy' (array, or dict of arrays for multi-column results) or 'arrow'
+            (pyarrow Table with the time index as its first column).
+        tail (int): Number of trailing rows to keep. Default is None (all rows).
+
+    Returns:
+        The result in the requested output type.
+    """
+    if result is None:
+        return None
+    rows = slice(-tail, None) if tail else slice(None)
+    if isinstance(result, (pd.Series, pd.DataFrame)):
+        if output == 'pandas':
+            return result if tail is None else result.iloc[rows]
+        if output == 'numpy' and isinstance(result, pd.Series):
+            return result.to_numpy()[rows]
+        if isinstance(result, pd.Series):
+            result = {result.name: result.to_numpy()}
+        else:
+            result = {name: result[name].to_numpy() for name in result.columns}
+
+    columns = {name: values[rows] for name, values in result.items()}
+    if output == 'pandas':
+        return pd.DataFrame(columns, index=index[rows])
+    if output == 'numpy':
+        return columns
+    return _arrow_table(index[rows], columns)
+
+
+def _arrow_table(index: pd.Index, columns: Dict[str, np.ndarray]):
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("output='arrow' requires pyarrow. Install it with `pip install pyarrow`.")
+    return pa.table({index.name or 'time': index.to_numpy(), **columns})
+
+
+class BaseIndicator:
+    def __init__(self, data: pd.DataFrame, output: str = 'pandas'):
+        """
+        Base class of the indicator families. Columns are read from the frame on every call, so edits made
+        to it in place are always seen.
+
+        Args:
+            data (pd.DataFrame): DataFrame containing price data with columns like 'close'.
+            output (str): Result type: 'pandas', 'numpy' or 'arrow'. Default is 'pandas'.
+        """
+        if output not in OUTPUT_TYPES:
+            raise ValueError(f"Unknown output: {output}. Valid outputs are {OUTPUT_TYPES}")
+        self.data = data
+        self.output = output
+
+    def _series(self, name: str) -> pd.Series:
+        return self.data[name]
+
+    def _array(self, name: str) -> np.ndarray:
+        """
+        Return the column as a contiguous float64 array. This is a view of the frame's own
+        memory whenever the column is already stored as float64.
+        """
+        return np.ascontiguousarray(self.data[name].to_numpy(dtype=np.float64))
+
+
+def converged(alpha: float, tol: float = CONVERGENCE_TOL) -> int:
+    """
+    Number of rows after which a recursive average with smoothing factor `alpha` has forgotten its seed.
+
+    Args:
+        alpha (float): Smoothing factor of the recursive average.
+        tol (float): Maximum weight left on the history before the window. Default is CONVERGENCE_TOL.
+
+    Returns:
+        int: Number of rows.
+    """
+    if alpha >= 1:
+        return 0
+    return int(math.ceil(math.log(tol) / math.log(1 - alpha)))
+
+
+def ema_warmup(length: int) -> int:
+    """
+    Warm-up rows for an EMA seeded with the SMA of its first `length` values.
+    """
+    return length - 1 + converged(2 / (length + 1))
+
+
+def rma_warmup(length: int) -> int:
+    """
+    Warm-up rows for Wilder's moving average (RMA), as used by RSI, ATR and ADX.
+    """
+    return length - 1 + converged(1 / length)
+
+
+def ma_warmup(mamode: str, length: int) -> int:
+    """
+    Warm-up rows for the moving average selected by `mamode`.
+    """
+    if mamode == 'ema':
+        return ema_warmup(length)
+    if mamode == 'rma':
+        return rma_warmup(length)
+    return length - 1
+
+
+def indicator_method(warmup: Callable[..., Optional[int]], inputs: Sequence[str] = ('close',)):
+    """
+    Declare how many rows an indicator method needs before the first row it returns, and which price columns.
+
+    The decorated method gains the `tail` mode: when called with `tail=N` only the last
+    `N + warmup` rows of the data are used and the last N rows of the result are returned.
+    The result is converted to the family's `output` type on the way out.
+
+    Args:
+        warmup (Callable): Called with the method arguments, returns the warm-up row count. Exact for
+            windowed indicators, convergence-based for recursive ones and None when the value depends on
+            the whole history (the full history is then computed before slicing).
+        inputs (Sequence[str]): Price columns the method reads, exposed as its `inputs` attribute. Default is ('close',).
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        def lookback(*args, **kwargs) -> Optional[int]:
+            bound = signature.bind(None, *args, **kwargs)
+            bound.apply_defaults()
+            params = dict(bound.arguments)
+            params.pop('self')
+            params.pop('tail', None)
+            return warmup(**params)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            tail = bound.arguments.get('tail')
+            target = self
+            if tail is not None:
+                if tail <= 0:
+                    raise ValueError(f"tail must be a positive number of rows, got {tail}")
+                rows = lookback(*args, **kwargs)
+                if rows is not None and tail + rows < len(self.data):
+                    target = type(self)(self.data.iloc[-(tail + rows):])
+            result = func(target, *bound.args[1:], **bound.kwargs)
+            return convert_output(result, target.data.index, self.output, tail)
+
+        wrapper.lookback = lookback
+        wrapper.inputs = tuple(inputs)
+        return wrapper
+    return decorator
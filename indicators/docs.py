@@ -4,6 +4,7 @@ SMA_DOC = """
 
     Args:
         length (int): The rolling window for lookback data. Default is 14.
+        tail (int): Only compute and return the last `tail` rows, using just the warm-up rows they need. Default is None (full history).
 
     Returns:
         pd.Series: Series containing the SMA values.
@@ -18,6 +19,7 @@ EMA_DOC = """
 
     Args:
         length (int): The rolling window for lookback data. Default is 14.
+        tail (int): Only compute and return the last `tail` rows, using just the warm-up rows they need. Default is None (full history).
 
     Returns:
         pd.Series: Series containing the EMA values.
@@ -35,6 +37,7 @@ VWAP_DOC = """
         implement various Timeseries Offset Aliases as listed here:
         https://pandas.pydata.org/pandas-docs/stable/user_guide/timeseries.html#timeseries-offset-aliases
         Default: "D".
+        tail (int): Only return the last `tail` rows. The full history is still computed since every value depends on it. Default is None.
     Returns:
         pd.Series: Series containing the VWAP values.
 
@@ -48,6 +51,7 @@ VWMA_DOC = """
 
     Args:
         length (int): The period for calculating VWMA. Default is 14.
+        tail (int): Only compute and return the last `tail` rows, using just the warm-up rows they need. Default is None (full history).
 
     Returns:
         pd.Series: Series containing the VWMA values.
@@ -59,13 +63,20 @@ VWMA_DOC = """
 
 OBV_DOC = """
     Calculate On Balance Volume (OBV) Indicator.
-    """
+
+    Args:
+        tail (int): Only return the last `tail` rows. The full history is still computed since every value depends on it. Default is None.
+
+    Returns:
+        pd.Series: Series containing the OBV values.
+"""
 
 ADX_DOC = """
     Calculate the Average Directional Movement Index (ADX).
 
     Args:
         length (int): The period for calculating ADX. Default is 14.
+        tail (int): Only compute and return the last `tail` rows, using just the warm-up rows they need. Default is None (full history).
 
     Returns:
         pd.Series: Series containing the ADX values.
@@ -80,6 +91,7 @@ AROON_DOC = """
 
     Args:
         length (int): The period for calculating Aroon. Default is 14.
+        tail (int): Only compute and return the last `tail` rows, using just the warm-up rows they need. Default is None (full history).
 
     Returns:
         pd.DataFrame: DataFrame containing Aroon Up, Aroon Down, and Aroon Oscillator values.
@@ -96,6 +108,7 @@ PSAR_DOC = """
         af0 (float): Initial Acceleration Factor. Default: 0.02
         af (float): Acceleration Factor. Default: 0.02
         max_af (float): Maximum Acceleration Factor. Default: 0.2
+        tail (int): Only return the last `tail` rows. The full history is still computed since every value depends on it. Default is None.
 
     Returns:
         pd.Series: Series containing the PSAR values.
@@ -112,6 +125,7 @@ SUPERTREND_DOC = """
         length (int) : length for ATR calculation. Default: 7
         multiplier (float): Coefficient for upper and lower band distance to
             midrange. Default: 3.0
+        tail (int): Only return the last `tail` rows. The full history is still computed since every value depends on it. Default is None.
 
     Returns:
         pd.DataFrame: DataFrame containing the Supertrend and Supertrend Direction values.
@@ -128,6 +142,7 @@ RSI_DOC = """
 
     Args:
         length (int): The rolling window for lookback data. Default is 14.
+        tail (int): Only compute and return the last `tail` rows, using just the warm-up rows they need. Default is None (full history).
 
     Returns:
         pd.Series: Series containing the RSI values.
@@ -144,6 +159,7 @@ MACD_DOC = """
         fast (int): The short period for calculating MACD. Default is 12.
         slow (int): The long period for calculating MACD. Default is 26.
         signal (int): The signal period for calculating MACD. Default is 9.
+        tail (int): Only compute and return the last `tail` rows, using just the warm-up rows they need. Default is None (full history).
 
     Returns:
         pd.DataFrame: DataFrame containing the MACD line, Signal line, and Histogram.
@@ -158,6 +174,7 @@ WILLR_DOC = """
 
     Args:
         length (int): The period for calculating Williams %R. Default is 14.
+        tail (int): Only compute and return the last `tail` rows, using just the warm-up rows they need. Default is None (full history).
 
     Returns:
         pd.Series: Series containing the Williams %R values.
@@ -171,6 +188,7 @@ CMO_DOC = """
 
     Args:
         length (int): The period for calculating CMO. Default is 14.
+        tail (int): Only compute and return the last `tail` rows, using just the warm-up rows they need. Default is None (full history).
 
     Returns:
         pd.Series: Series containing the CMO values.
@@ -186,6 +204,7 @@ STOCH_DOC = """
         k (int): The period for the %K line. Default is 14.
         d (int): The period for the %D line. Default is 1.
         smooth_k (int): The smoothing period for the %K line. Default is 3.
+        tail (int): Only compute and return the last `tail` rows, using just the warm-up rows they need. Default is None (full history).
 
     Returns:
         pd.DataFrame: DataFrame containing the %K and %D values.
@@ -200,6 +219,7 @@ ROC_DOC = """
 
     Args:
         length (int): The period for calculating ROC. Default is 14.
+        tail (int): Only compute and return the last `tail` rows, using just the warm-up rows they need. Default is None (full history).
 
     Returns:
         pd.Series: Series containing the ROC values.
@@ -214,6 +234,7 @@ MOM_DOC = """
 
     Args:
         length (int): The period for calculating MOM. Default is 14.
+        tail (int): Only compute and return the last `tail` rows, using just the warm-up rows they need. Default is None (full history).
 
     Returns:
         pd.Series: Series containing the MOM values.
@@ -231,6 +252,7 @@ BBANDS_DOC = """
     Args:
         length (int): The rolling window for lookback data. Default is 14.
         std (float): The number of standard deviations to use. Default is 2.
+        tail (int): Only compute and return the last `tail` rows, using just the warm-up rows they need. Default is None (full history).
 
     Returns:
         pd.DataFrame: DataFrame containing the Bollinger Bands values (lower, middle, upper).
@@ -247,16 +269,40 @@ KC_DOC = """
         length (int): The period for calculating KC. Default is 20.
         scalar (float): ATR scalar. Default is 2.0.
         mamode (str): The Moving Average mode. Default is 'ema'.
+        tail (int): Only compute and return the last `tail` rows, using just the warm-up rows they need. Default is None (full history).
 
     Returns:
         pd.DataFrame: DataFrame containing the Keltner Channels values (lower, middle, upper).
 """
 
+SQUEEZE_DOC = """
+    Calculate Bollinger Bands, Keltner Channels and the Squeeze signal in a single pass.
+
+    Both band sets share the simple moving average of close, so the squeeze is on when the
+    Bollinger Bands sit inside the Keltner Channels.
+
+    Args:
+        length (int): The rolling window shared by both band sets. Default is 20.
+        std (float): The number of standard deviations for the Bollinger Bands. Default is 2.
+        scalar (float): The True Range multiplier for the Keltner Channels. Default is 1.5.
+        tail (int): Only compute and return the last `tail` rows, using just the warm-up rows they need. Default is None (full history).
+
+    Returns:
+        pd.DataFrame: DataFrame containing the Bollinger Bands (lower, middle, upper, bandwidth, %B),
+        the Keltner Channels (lower, basis, upper) and the SQZ_ON flag (1 when the squeeze is on). Columns are named
+        like those of bbands and kc with mamode='sma', e.g. BBL_20_2.0 and KCLs_20_1.5.
+
+    Reference:
+        - TradingView: https://www.tradingview.com/support/solutions/43000501963-bollinger-bands-bb/
+        - Investopedia: https://www.investopedia.com/terms/k/keltnerchannel.asp
+"""
+
 ATR_DOC = """
     Calculate the Average True Range (ATR).
 
     Args:
         length (int): The period for calculating ATR. Default is 14.
+        tail (int): Only compute and return the last `tail` rows, using just the warm-up rows they need. Default is None (full history).
 
     Returns:
         pd.Series: Series containing the ATR values.
@@ -271,6 +317,7 @@ STDEV_DOC = """
     Args:
         length (int): The period for calculating Standard Deviation. Default is 14.
         ddof (int): Delta degrees of freedom for the calculation. Default is 1.
+        tail (int): Only compute and return the last `tail` rows, using just the warm-up rows they need. Default is None (full history).
 
     Returns:
         pd.Series: Series containing the Standard Deviation values.
@@ -284,6 +331,7 @@ LINREG_DOC = """
 
     Args:
         length (int): The period for calculating Linear Regression. Default is 14.
+        tail (int): Only compute and return the last `tail` rows, using just the warm-up rows they need. Default is None (full history).
 
     Returns:
         pd.Series: Series containing the Linear Regression values.
@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def rolling_windows(values: np.ndarray, length: int) -> np.ndarray:
+    """
+    Return a zero-copy (n - length + 1, length) view of the trailing windows of `values`.
+    """
+    return sliding_window_view(values, length)
+
+
+def pad_front(values: np.ndarray, n: int) -> np.ndarray:
+    """
+    Left-pad a windowed result with NaN so that it lines up with the original n rows.
+    """
+    out = np.full(n, np.nan)
+    if len(values):
+        out[n - len(values):] = values
+    return out
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """
+    Calculate the True Range. The first bar has no previous close and falls back to high - low.
+    """
+    prev_close = np.empty_like(close)
+    prev_close[0] = np.nan
+    prev_close[1:] = close[:-1]
+    ranges = np.vstack([high - low, np.abs(high - prev_close), np.abs(low - prev_close)])
+    return np.nanmax(ranges, axis=0)
+
+
+def squeeze(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+            length: int = 20, std: float = 2.0, scalar: float = 1.5) -> Dict[str, np.ndarray]:
+    """
+    Compute Bollinger Bands, Keltner Channels, band width, %B and the squeeze flag in one pass.
+
+    Both band sets share the same simple moving average of close. The Bollinger deviation is the
+    population standard deviation (ddof=0, as in `ta.bbands`) and the Keltner range is the simple
+    moving average of the True Range over the same windows.
+
+    Returns:
+        Dict[str, np.ndarray]: Column name to values, all aligned with the input rows.
+    """
+    n = len(close)
+    if n < length:
+        nan = np.full(n, np.nan)
+        columns = ['BBL', 'BBM', 'BBU', 'BBB', 'BBP', 'KCL', 'KCB', 'KCU', 'SQZ_ON']
+        return {name: nan.copy() for name in columns}
+
+    close_windows = rolling_windows(close, length)
+    basis = close_windows.mean(axis=1)
+    deviation = close_windows.std(axis=1)
+    band = rolling_windows(true_range(high, low, close), length).mean(axis=1)
+
+    bb_lower = basis - std * deviation
+    bb_upper = basis + std * deviation
+    kc_lower = basis - scalar * band
+    kc_upper = basis + scalar * band
+
+    width = bb_upper - bb_lower
+    with np.errstate(divide='ignore', invalid='ignore'):
+        bandwidth = np.where(basis != 0, 100 * width / basis, np.nan)
+        percent = np.where(width != 0, (close[length - 1:] - bb_lower) / width, np.nan)
+    squeeze_on = ((bb_lower > kc_lower) & (bb_upper < kc_upper)).astype(float)
+
+    return {
+        'BBL': pad_front(bb_lower, n),
+        'BBM': pad_front(basis, n),
+        'BBU': pad_front(bb_upper, n),
+        'BBB': pad_front(bandwidth, n),
+        'BBP': pad_front(percent, n),
+        'KCL': pad_front(kc_lower, n),
+        'KCB': pad_front(basis, n),
+        'KCU': pad_front(kc_upper, n),
+        'SQZ_ON': pad_front(squeeze_on, n),
+    }
+
+
+# Wide kernels: one column per symbol, one row per bar. Each indicator runs once over the whole universe
+# instead of once per symbol, and gaps (NaN) stay confined to their own column.
+
+def wide_rsi(close: pd.DataFrame, length: int = 14) -> pd.DataFrame:
+    """
+    Relative Strength Index of every column, with Wilder's smoothing (RMA) as in `ta.rsi`.
+    """
+    change = close.diff()
+    gain = change.clip(lower=0).ewm(alpha=1 / length, adjust=False).mean()
+    loss = (-change.clip(upper=0)).ewm(alpha=1 / length, adjust=False).mean()
+    return 100 * gain / (gain + loss)
+
+
+def wide_roc(close: pd.DataFrame, length: int = 9) -> pd.DataFrame:
+    """
+    Rate of change of every column over `length` bars, in percent.
+    """
+    return 100 * (close / close.shift(length) - 1)
+
+
+def wide_sma_distance(close: pd.DataFrame, length: int = 200) -> pd.DataFrame:
+    """
+    Distance of every column from its simple moving average, in percent.
+    """
+    return 100 * (close / close.rolling(length).mean() - 1)
+
+
+WIDE_KERNELS: Dict[str, Callable[[pd.DataFrame, int], pd.DataFrame]] = {
+    'rsi': wide_rsi,
+    'roc': wide_roc,
+    'sma_distance': wide_sma_distance,
+}
@@ -1,49 +1,58 @@
 import pandas as pd
 from pta_reload import ta
 from typing import Union
+from .base import BaseIndicator, indicator_method, ema_warmup, rma_warmup
 from .docs import *
 
-class MomentumIndicator:
-    def __init__(self, data: pd.DataFrame):
+class MomentumIndicator(BaseIndicator):
+    def __init__(self, data: pd.DataFrame, output: str = 'pandas'):
         """
         Calculate Momentum Indicators.
 
         Args:
             data (pd.DataFrame): DataFrame containing price data with columns like 'close'.
+            output (str): Result type: 'pandas', 'numpy' or 'arrow'. Default is 'pandas'.
         """
-        self.data = data
+        super().__init__(data, output)
 
-    def rsi(self, length: int = 14) -> pd.Series:
-        rsi_data = ta.rsi(self.data['close'], length=length, talib=False)
+    @indicator_method(warmup=lambda length, **_: rma_warmup(length) + 1)
+    def rsi(self, length: int = 14, tail: int = None) -> pd.Series:
+        rsi_data = ta.rsi(self._series('close'), length=length, talib=False)
         return rsi_data
     rsi.__doc__ = RSI_DOC
 
-    def macd(self, fast: int = 12, slow: int = 26, signal: int = 9) -> pd.DataFrame:
-        macd_df = ta.macd(self.data['close'], fast=fast, slow=slow, signal=signal, talib=False)
+    @indicator_method(warmup=lambda slow, signal, **_: ema_warmup(slow) + ema_warmup(signal))
+    def macd(self, fast: int = 12, slow: int = 26, signal: int = 9, tail: int = None) -> pd.DataFrame:
+        macd_df = ta.macd(self._series('close'), fast=fast, slow=slow, signal=signal, talib=False)
         return macd_df
     macd.__doc__ = MACD_DOC
 
-    def willr(self, length: int = 14) -> pd.Series:
-        willr_data = ta.willr(self.data['high'], self.data['low'], self.data['close'], length=length, talib=False)
+    @indicator_method(warmup=lambda length, **_: length - 1, inputs=('high', 'low', 'close'))
+    def willr(self, length: int = 14, tail: int = None) -> pd.Series:
+        willr_data = ta.willr(self._series('high'), self._series('low'), self._series('close'), length=length, talib=False)
         return willr_data
     willr.__doc__ = WILLR_DOC
 
-    def cmo(self, length: int = 9) -> pd.Series:
-        cmo_data = ta.cmo(self.data['close'], length=length, talib=False)
+    @indicator_method(warmup=lambda length, **_: length)
+    def cmo(self, length: int = 9, tail: int = None) -> pd.Series:
+        cmo_data = ta.cmo(self._series('close'), length=length, talib=False)
         return cmo_data
     cmo.__doc__ = CMO_DOC
 
-    def stoch(self, k: int = 14, d: int = 3, smooth_k: int = 3) -> pd.DataFrame:
-        stoch_data = ta.stoch(self.data['high'], self.data['low'], self.data['close'], k=k, d=d, smooth_k=smooth_k)
+    @indicator_method(warmup=lambda k, d, smooth_k, **_: k + smooth_k + d - 3, inputs=('high', 'low', 'close'))
+    def stoch(self, k: int = 14, d: int = 3, smooth_k: int = 3, tail: int = None) -> pd.DataFrame:
+        stoch_data = ta.stoch(self._series('high'), self._series('low'), self._series('close'), k=k, d=d, smooth_k=smooth_k)
         return stoch_data
     stoch.__doc__ = STOCH_DOC
 
-    def roc(self, length: int = 9) -> pd.Series:
-        roc_data = ta.roc(self.data['close'], length=length, talib=False)
+    @indicator_method(warmup=lambda length, **_: length)
+    def roc(self, length: int = 9, tail: int = None) -> pd.Series:
+        roc_data = ta.roc(self._series('close'), length=length, talib=False)
         return roc_data
     roc.__doc__ = ROC_DOC
 
-    def mom(self, length: int = 10) -> pd.Series:
-        mom_data = ta.mom(self.data['close'], length=length, talib=False)
+    @indicator_method(warmup=lambda length, **_: length)
+    def mom(self, length: int = 10, tail: int = None) -> pd.Series:
+        mom_data = ta.mom(self._series('close'), length=length, talib=False)
         return mom_data
     mom.__doc__ = MOM_DOC
\ No newline at end of file
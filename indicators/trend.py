@@ -1,54 +1,64 @@
 import pandas as pd
 from pta_reload import ta
 from typing import Union
+from .base import BaseIndicator, indicator_method, ema_warmup, rma_warmup
 from .docs import *
 
-class TrendIndicator:
-    def __init__(self, data: pd.DataFrame):
+class TrendIndicator(BaseIndicator):
+    def __init__(self, data: pd.DataFrame, output: str = 'pandas'):
         """
         Calculate Trend Indicators.
 
         Args:
             data (pd.DataFrame): DataFrame containing price data with columns like 'close'.
+            output (str): Result type: 'pandas', 'numpy' or 'arrow'. Default is 'pandas'.
         """
-        self.data = data
+        super().__init__(data, output)
 
-    def sma(self, length: int = 14) -> pd.Series:
-        sma_data = ta.sma(self.data['close'], length=length, talib=False)
+    @indicator_method(warmup=lambda length, **_: length - 1)
+    def sma(self, length: int = 14, tail: int = None) -> pd.Series:
+        sma_data = ta.sma(self._series('close'), length=length, talib=False)
         return sma_data
     sma.__doc__ = SMA_DOC
 
-    def ema(self, length: int = 14) -> pd.Series:
-        ema_data = ta.ema(self.data['close'], length=length, talib=False)
+    @indicator_method(warmup=lambda length, **_: ema_warmup(length))
+    def ema(self, length: int = 14, tail: int = None) -> pd.Series:
+        ema_data = ta.ema(self._series('close'), length=length, talib=False)
         return ema_data
     ema.__doc__ = EMA_DOC
 
-    def vwap(self, anchor:str = 'D') -> pd.Series:
-        vwap_data = ta.vwap(high=self.data['high'], low=self.data['low'], close=self.data['close'], volume=self.data['volume'], anchor=anchor)
+    @indicator_method(warmup=lambda **_: None, inputs=('high', 'low', 'close', 'volume'))
+    def vwap(self, anchor:str = 'D', tail: int = None) -> pd.Series:
+        vwap_data = ta.vwap(high=self._series('high'), low=self._series('low'), close=self._series('close'), volume=self._series('volume'), anchor=anchor)
         return vwap_data
     vwap.__doc__ = VWAP_DOC
 
-    def vwma(self, length: int = 20) -> pd.Series:
-        vwma_data = ta.vwma(self.data['close'], self.data['volume'], length=length, talib=False)
+    @indicator_method(warmup=lambda length, **_: length - 1, inputs=('close', 'volume'))
+    def vwma(self, length: int = 20, tail: int = None) -> pd.Series:
+        vwma_data = ta.vwma(self._series('close'), self._series('volume'), length=length, talib=False)
         return vwma_data
     vwma.__doc__ = VWMA_DOC
     
-    def adx(self, length: int = 14) -> pd.Series:
-        adx_data = ta.adx(high=self.data['high'], low=self.data['low'], close=self.data['close'], length=length)
+    @indicator_method(warmup=lambda length, **_: 2 * rma_warmup(length) + 1, inputs=('high', 'low', 'close'))
+    def adx(self, length: int = 14, tail: int = None) -> pd.Series:
+        adx_data = ta.adx(high=self._series('high'), low=self._series('low'), close=self._series('close'), length=length)
         return adx_data
     adx.__doc__ = ADX_DOC
 
-    def aroon(self, length: int = 14) -> pd.DataFrame:
-        aroon_data = ta.aroon(high=self.data['high'], low=self.data['low'], length=length, talib=False)
+    @indicator_method(warmup=lambda length, **_: length, inputs=('high', 'low'))
+    def aroon(self, length: int = 14, tail: int = None) -> pd.DataFrame:
+        aroon_data = ta.aroon(high=self._series('high'), low=self._series('low'), length=length, talib=False)
         return aroon_data
     aroon.__doc__ = AROON_DOC
 
-    def psar(self, af0: float = 0.02, af: float = 0.02, max_af: float = 0.2) -> pd.Series:
-        psar_data = ta.psar(high=self.data['high'], low=self.data['low'], close=None, af=af, max_af=max_af)
+    @indicator_method(warmup=lambda **_: None, inputs=('high', 'low'))
+    def psar(self, af0: float = 0.02, af: float = 0.02, max_af: float = 0.2, tail: int = None) -> pd.Series:
+        psar_data = ta.psar(high=self._series('high'), low=self._series('low'), close=None, af=af, max_af=max_af)
         return psar_data
     psar.__doc__ = PSAR_DOC
 
-    def supertrend(self, length: int = 10, multiplier: float = 3) -> pd.DataFrame:
-        supertrend_df = ta.supertrend(high=self.data['high'], low=self.data['low'], close=self.data['close'], length=length, multiplier=multiplier)
+    @indicator_method(warmup=lambda **_: None, inputs=('high', 'low', 'close'))
+    def supertrend(self, length: int = 10, multiplier: float = 3, tail: int = None) -> pd.DataFrame:
+        supertrend_df = ta.supertrend(high=self._series('high'), low=self._series('low'), close=self._series('close'), length=length, multiplier=multiplier)
         return supertrend_df
     supertrend.__doc__ = SUPERTREND_DOC
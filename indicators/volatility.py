@@ -1,39 +1,57 @@
 import pandas as pd
 from pta_reload import ta
+from . import kernels
 from typing import Union
+from .base import BaseIndicator, indicator_method, rma_warmup, ma_warmup
 from .docs import *
 
-class VolatilityIndicator:
-    def __init__(self, data: pd.DataFrame):
+class VolatilityIndicator(BaseIndicator):
+    def __init__(self, data: pd.DataFrame, output: str = 'pandas'):
         """
         Calculate Volatility Indicators.
 
         Args:
             data (pd.DataFrame): DataFrame containing price data with columns like 'close'.
+            output (str): Result type: 'pandas', 'numpy' or 'arrow'. Default is 'pandas'.
         """
-        self.data = data
+        super().__init__(data, output)
 
-    def bbands(self, length: int = 14, std: float = 2) -> pd.DataFrame:
-        bbands_series = ta.bbands(self.data['close'], length=length, std=std, talib=False)
+    @indicator_method(warmup=lambda length, **_: length - 1)
+    def bbands(self, length: int = 14, std: float = 2, tail: int = None) -> pd.DataFrame:
+        bbands_series = ta.bbands(self._series('close'), length=length, std=std, talib=False)
         return bbands_series
     bbands.__doc__ = BBANDS_DOC
 
-    def kc(self, length: int = 20, scalar: float = 2.0, mamode: str = 'ema') -> pd.DataFrame:
-        kc_series = ta.kc(high=self.data['high'], low=self.data['low'], close=self.data['close'], length=length, scalar=scalar, mamode=mamode)
+    @indicator_method(warmup=lambda length, mamode, **_: ma_warmup(mamode, length) + 1, inputs=('high', 'low', 'close'))
+    def kc(self, length: int = 20, scalar: float = 2.0, mamode: str = 'ema', tail: int = None) -> pd.DataFrame:
+        kc_series = ta.kc(high=self._series('high'), low=self._series('low'), close=self._series('close'), length=length, scalar=scalar, mamode=mamode)
         return kc_series
     kc.__doc__ = KC_DOC
 
-    def atr(self, length: int = 14) -> pd.Series:
-        atr_series = ta.atr(self.data['high'], self.data['low'], self.data['close'], length=length, talib=False)
+    @indicator_method(warmup=lambda length, **_: length, inputs=('high', 'low', 'close'))
+    def squeeze(self, length: int = 20, std: float = 2.0, scalar: float = 1.5, tail: int = None) -> pd.DataFrame:
+        squeeze_data = kernels.squeeze(self._array('high'), self._array('low'), self._array('close'), length=length, std=std, scalar=scalar)
+        # Same column names as ta.bbands and ta.kc: the Keltner Channels here use simple moving averages ('s').
+        bb_props, kc_props = f"_{length}_{std}", f"s_{length}_{scalar}"
+        columns = {name: f"{name}{kc_props if name.startswith('KC') else bb_props}" for name in squeeze_data}
+        columns['SQZ_ON'] = 'SQZ_ON'
+        return {columns[name]: values for name, values in squeeze_data.items()}
+    squeeze.__doc__ = SQUEEZE_DOC
+
+    @indicator_method(warmup=lambda length, **_: rma_warmup(length) + 1, inputs=('high', 'low', 'close'))
+    def atr(self, length: int = 14, tail: int = None) -> pd.Series:
+        atr_series = ta.atr(self._series('high'), self._series('low'), self._series('close'), length=length, talib=False)
         return atr_series
     atr.__doc__ = ATR_DOC
     
-    def stdev(self, length: int = 14, ddof: int = 1) -> pd.Series:
-        stdev_series = ta.stdev(self.data['close'], length=length, ddof=ddof, talib=False)
+    @indicator_method(warmup=lambda length, **_: length - 1)
+    def stdev(self, length: int = 14, ddof: int = 1, tail: int = None) -> pd.Series:
+        stdev_series = ta.stdev(self._series('close'), length=length, ddof=ddof, talib=False)
         return stdev_series
     stdev.__doc__ = STDEV_DOC
     
-    def linreg(self, length: int = 14) -> pd.Series:
-        linreg_series = ta.linreg(self.data['close'], length=length)
+    @indicator_method(warmup=lambda length, **_: length - 1)
+    def linreg(self, length: int = 14, tail: int = None) -> pd.Series:
+        linreg_series = ta.linreg(self._series('close'), length=length)
         return linreg_series
     linreg.__doc__ = LINREG_DOC
\ No newline at end of file
@@ -1,19 +1,22 @@
 import pandas as pd
 from pta_reload import ta
 from typing import Union
+from .base import BaseIndicator, indicator_method
 from .docs import *
 
-class VolumeIndicator:
-    def __init__(self, data: pd.DataFrame):
+class VolumeIndicator(BaseIndicator):
+    def __init__(self, data: pd.DataFrame, output: str = 'pandas'):
         """
         Calculate Volume Indicators.
 
         Args:
             data (pd.DataFrame): DataFrame containing price data with columns like 'close'.
+            output (str): Result type: 'pandas', 'numpy' or 'arrow'. Default is 'pandas'.
         """
-        self.data = data
+        super().__init__(data, output)
 
-    def obv(self) -> pd.Series:
-        obv_series = ta.obv(self.data['close'], self.data['volume'], talib=False)
+    @indicator_method(warmup=lambda **_: None, inputs=('close', 'volume'))
+    def obv(self, tail: int = None) -> pd.Series:
+        obv_series = ta.obv(self._series('close'), self._series('volume'), talib=False)
         return obv_series
     obv.__doc__ = OBV_DOC
\ No newline at end of file
@@ -1,45 +1,150 @@
+import functools
 import pandas as pd
-from typing import Union
+import numpy as np
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, Union
 from vnstock_ta.indicators.trend import TrendIndicator
 from vnstock_ta.indicators.momentum import MomentumIndicator
 from vnstock_ta.indicators.volatility import VolatilityIndicator
 from vnstock_ta.indicators.volume import VolumeIndicator
+from vnstock_ta.indicators.base import OUTPUT_TYPES
 from vnstock_ta.chart.trend import TATrend
 from vnstock_ta.chart.momentum import TAMomentum
 from vnstock_ta.chart.volatility import TAVolatility
 from vnstock_ta.chart.volume import TAVolume
+from vnstock_ta.chart.core import ChartContext
 from vnstock_ta.utils.const import _ISLAND_GREEN, _ORANGE, _TURKISH_SEA, _SLATE_BLUE, _GRADIENT_EMERALD, NEUTRAL_INFORMATION_COMPLETE, DARK_MODE_PRIMARY_COLORS, DARK_MODE_SECONDARY_COLORS, LIGHT_MODE_PRIMARY_COLORS, LIGHT_MODE_SECONDARY_COLORS
 from vnstock_ta.indicators.docs import *
 
 class Indicator:
-    def __init__(self, data: pd.DataFrame):
+    def __init__(self, data: pd.DataFrame, output: str = 'pandas'):
         """
         Calculate Technical Indicator Data.
         
         Args:
             data (pd.DataFrame): DataFrame containing price data with columns like 'close'.
+            output (str): Result type of every indicator: 'pandas' (Series/DataFrame), 'numpy' (array, or dict
+                of arrays for multi-column indicators) or 'arrow' (pyarrow Table with the time index as a column).
+                Default is 'pandas'.
         """
+        if output not in OUTPUT_TYPES:
+            raise ValueError(f"Unknown output: {output}. Valid outputs are {OUTPUT_TYPES}")
         self.data = data
-        self.trend = TrendIndicator(data)
-        self.momentum = MomentumIndicator(data)
-        self.volatility = VolatilityIndicator(data)
-        self.volume = VolumeIndicator(data)
-        
-        # Bind methods from sub-components to the Indicator instance
-        self._bind_methods()
+        self.output = output
+
+    # Sub-components are built on first use. Their public methods are delegated at class level
+    # by _bind_methods below, so construction copies nothing per instance.
+    @functools.cached_property
+    def trend(self) -> TrendIndicator:
+        return TrendIndicator(self.data, output=self.output)
+
+    @functools.cached_property
+    def momentum(self) -> MomentumIndicator:
+        return MomentumIndicator(self.data, output=self.output)
 
-    def _bind_methods(self):
-        components = [self.trend, self.momentum, self.volatility, self.volume]
-        for component in components:
-            for attr_name in dir(component):
-                if callable(getattr(component, attr_name)) and not attr_name.startswith("_"):
-                    setattr(self, attr_name, getattr(component, attr_name))
+    @functools.cached_property
+    def volatility(self) -> VolatilityIndicator:
+        return VolatilityIndicator(self.data, output=self.output)
+
+    @functools.cached_property
+    def volume(self) -> VolumeIndicator:
+        return VolumeIndicator(self.data, output=self.output)
+
+    @classmethod
+    def compute_chunks(cls, chunks: Iterable[pd.DataFrame], indicators: List[Union[str, Tuple[str, Dict[str, Any]]]],
+                       writer: Callable[[pd.DataFrame], None] = None) -> Union[Iterator[pd.DataFrame], None]:
+        """
+        Calculate indicators over a history delivered in chunks, e.g. Parquet row groups.
+
+        Each chunk is computed together with the last rows of the previous ones, as many as the
+        indicators declare for their warm-up, so peak memory is bounded by the chunk size. Chunks too
+        short for an indicator to be calculated are merged with the following ones and yielded together;
+        a history too short as a whole gets NaN.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): Consecutive price data chunks in time order.
+            indicators (List[Union[str, Tuple[str, Dict[str, Any]]]]): Indicator method names, or
+                (name, params) pairs such as ('sma', {'length': 20}).
+            writer (Callable[[pd.DataFrame], None]): Called with the result of every chunk. Default is None.
+
+        Returns:
+            Iterator[pd.DataFrame]: The indicator values of each chunk (or merged run of short chunks) when no writer
+                is given, otherwise None.
+
+        Example:
+            >>> row_groups = (pq_file.read_row_group(i).to_pandas().set_index('time') for i in range(pq_file.num_row_groups))
+            >>> Indicator.compute_chunks(row_groups, ['rsi', ('sma', {'length': 50})], writer=sink.write)
+        """
+        specs = [(spec, {}) if isinstance(spec, str) else spec for spec in indicators]
+        results = cls._iter_chunks(chunks, specs)
+        if writer is None:
+            return results
+        for result in results:
+            writer(result)
+
+    @classmethod
+    def _iter_chunks(cls, chunks: Iterable[pd.DataFrame], specs: List[Tuple[str, Dict[str, Any]]]) -> Iterator[pd.DataFrame]:
+        carry = None
+        pending = None
+        lookback = None
+        for chunk in chunks:
+            if chunk.empty:
+                continue
+            pending = chunk if pending is None else pd.concat([pending, chunk])
+            frame = pending if carry is None else pd.concat([carry, pending])
+            indicator = cls(frame)
+            if lookback is None:
+                lookback = indicator._chunk_lookback(specs)
+
+            results = [getattr(indicator, name)(**params) for name, params in specs]
+            if any(result is None for result in results):
+                # Too few rows for an indicator yet: the chunk waits for the next ones, so that its rows
+                # are calculated from the same history as in a single pass over the whole data.
+                continue
+            carry = frame.iloc[max(len(frame) - lookback, 0):]
+            yield pd.concat([result.iloc[-len(pending):] for result in results], axis=1)
+            pending = None
+
+        if pending is not None:
+            # The whole history is too short for some indicators: they have no value for these rows.
+            frame = pending if carry is None else pd.concat([carry, pending])
+            indicator = cls(frame)
+            columns = []
+            for name, params in specs:
+                result = getattr(indicator, name)(**params)
+                if result is None:
+                    result = cls._warmup_rows(frame, lookback, name, params)
+                columns.append(result.iloc[-len(pending):])
+            yield pd.concat(columns, axis=1)
+
+    @classmethod
+    def _warmup_rows(cls, frame: pd.DataFrame, lookback: int, name: str, params: Dict[str, Any]) -> Union[pd.Series, pd.DataFrame]:
+        """
+        All-NaN result of an indicator for rows that are too few to calculate it, with the columns it would have.
+        """
+        # Only the column names of the padded result are used: its values are replaced by NaN.
+        padded = pd.concat([frame.iloc[[0] * lookback], frame], ignore_index=True)
+        result = getattr(cls(padded), name)(**params)
+        if result is None:
+            raise ValueError(f"Not enough rows to calculate {name}{params}.")
+        if isinstance(result, pd.Series):
+            return pd.Series(np.nan, index=frame.index, name=result.name)
+        return pd.DataFrame(np.nan, index=frame.index, columns=result.columns)
+
+    def _chunk_lookback(self, specs: List[Tuple[str, Dict[str, Any]]]) -> int:
+        rows = {name: getattr(self, name).lookback(**params) for name, params in specs}
+        unsupported = [name for name, lookback in rows.items() if lookback is None]
+        if unsupported:
+            raise ValueError(f"{unsupported} depend on the whole history and cannot be calculated in chunks.")
+        return max(rows.values(), default=0)
 
     def __getattr__(self, name):
         raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
 
+_PLOTTER_COMPONENTS = {'trend': TATrend, 'momentum': TAMomentum, 'volatility': TAVolatility, 'volume': TAVolume}
+
 class Plotter:
-    def __init__(self, data: pd.DataFrame, theme: str = 'light', watermark:bool=False, display:bool=True):
+    def __init__(self, data: pd.DataFrame, theme: str = 'light', watermark:bool=False, display:bool=True, max_points: int = None,
+                 shared_dataset: bool = False):
         """
         Plot Technical Analysis Chart.
         
@@ -47,27 +152,114 @@ class Plotter:
             data (pd.DataFrame): DataFrame containing price data with columns like 'close'.
             theme (str): 'light' or 'dark'. Default is 'light'.
             watermark (bool): Display watermark on the chart. Default is True.
-            display (bool): Display the chart. Default is True.
+            display (Union[bool, str]): Display the chart. Default is True. False returns the chart object, 'html' the standalone
+                HTML page as a string and 'json' the compact ECharts option as a JSON string.
+            max_points (int): Maximum number of points per series; longer histories are downsampled before rendering. Default is None (all points).
+            shared_dataset (bool): Emit the series data as one shared ECharts dataset instead of one copy per series,
+                which shrinks multi-line charts (SMA list, BBANDS, KC, MACD). Default is False.
         """
         self.data = data
         self.theme = theme
-        self.trend = TATrend(data, theme, watermark, display)
-        self.momentum = TAMomentum(data, theme, watermark, display)
-        self.volatility = TAVolatility(data, theme, watermark, display)
-        self.volume = TAVolume(data, theme, watermark, display)
-        
-        # Bind methods from sub-components to the Plotter instance
-        self._bind_methods()
+        self.watermark = watermark
+        self.display = display
+        # One indicator engine, BaseChart and prepared-series cache shared by all chart families.
+        self._context = ChartContext(data, theme, max_points, shared_dataset)
 
-    def _bind_methods(self):
-        components = [self.trend, self.momentum, self.volatility, self.volume]
-        for component in components:
-            for attr_name in dir(component):
-                if callable(getattr(component, attr_name)) and not attr_name.startswith("_"):
-                    setattr(self, attr_name, getattr(component, attr_name))
+    @functools.cached_property
+    def trend(self) -> TATrend:
+        return TATrend(self.data, self.theme, self.watermark, self.display, context=self._context)
+
+    @functools.cached_property
+    def momentum(self) -> TAMomentum:
+        return TAMomentum(self.data, self.theme, self.watermark, self.display, context=self._context)
+
+    @functools.cached_property
+    def volatility(self) -> TAVolatility:
+        return TAVolatility(self.data, self.theme, self.watermark, self.display, context=self._context)
+
+    @functools.cached_property
+    def volume(self) -> TAVolume:
+        return TAVolume(self.data, self.theme, self.watermark, self.display, context=self._context)
+
+    def dashboard(self, overlays: List[Union[str, Tuple[str, Dict[str, Any]]]] = None, subplots: List[Union[str, Tuple[str, Dict[str, Any]]]] = None,
+                  title: str = 'Dashboard', minimal: bool = False, width: str = None, height: str = None):
+        """
+        Compose one chart from several indicators: the price and volume panels are built once, the overlays are drawn on
+        the price panel and each subplot gets its own panel below the volume. All panels share the x-axis and zoom.
+
+        Args:
+            overlays: Indicators drawn on the price panel, as method names ('sma') or (name, params) pairs (('bbands', {'length': 20})).
+            subplots: Indicators drawn in their own panel, in the same format, e.g. ['rsi', 'macd', ('adx', {'length': 20})].
+            title (str): Title of the dashboard.
+            minimal (bool): Show the price as a line instead of candlesticks. Default is False.
+            width (str): Width of the chart. Default is None (1500px).
+            height (str): Height of the chart. Default is None (900px, plus 150px per extra subplot).
+
+        Returns:
+            The rendered chart, or the chart object when display is False.
+        """
+        chart = self._context.chart
+        if minimal:
+            main_chart, volume_chart = chart._price_volume(title=title, area_style=False, watermark=self.watermark)
+        else:
+            main_chart, volume_chart = chart._candlestick(title=title, watermark=self.watermark)
+        for _, layer in self._layers(overlays):
+            main_chart = main_chart.overlap(layer)
+        grid_chart = chart._stacked_layout(main_chart, volume_chart, self._layers(subplots), title=title, chart_height=height, chart_width=width)
+        return chart._render(grid_chart, display=self.display)
+
+    def _layers(self, indicators: List[Union[str, Tuple[str, Dict[str, Any]]]]) -> List[Tuple[str, Any]]:
+        """
+        Build the (title, indicator layer) pairs of a dashboard with collecting copies of the chart families, sharing this Plotter's context.
+        """
+        collectors = {}
+        layers = []
+        for indicator in indicators or []:
+            name, params = (indicator, {}) if isinstance(indicator, str) else indicator
+            component = next((component for component, component_cls in _PLOTTER_COMPONENTS.items()
+                              if not name.startswith('_') and callable(getattr(component_cls, name, None))), None)
+            if component is None:
+                raise ValueError(f"Unknown indicator: {name}")
+            if component not in collectors:
+                collector = _PLOTTER_COMPONENTS[component](self.data, self.theme, self.watermark, display=False, context=self._context)
+                collector._collect = True
+                collectors[component] = collector
+            layers.append(getattr(collectors[component], name)(**params))
+        return layers
+
+    def zoom(self, start=None, end=None, max_points: int = 2000, title: str = 'Candlestick Chart'):
+        """
+        Candlestick and volume chart of the range [start, end] at the finest bar resolution that fits in `max_points` bars.
+
+        Args:
+            start: First timestamp of the range. Default is None (start of the data).
+            end: Last timestamp of the range. Default is None (end of the data).
+            max_points (int): Maximum number of bars sent to the browser. Default is 2000.
+            title (str): Title of the chart.
+        """
+        return self._context.chart.zoom_trading_chart(start, end, max_points, title=title, display=self.display, watermark=self.watermark)
 
     def __getattr__(self, name):
         raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
 
 
+def _delegate(component: str, name: str, method: Callable) -> Callable:
+    @functools.wraps(method)
+    def delegate(self, *args, **kwargs):
+        return getattr(getattr(self, component), name)(*args, **kwargs)
+    return delegate
+
+
+def _bind_methods(cls: type, components: Dict[str, type]):
+    """
+    Expose the public methods of each sub-component class on `cls`, forwarding to the instance's sub-component.
+    """
+    for component, component_cls in components.items():
+        for name in dir(component_cls):
+            method = getattr(component_cls, name)
+            if callable(method) and not name.startswith("_"):
+                setattr(cls, name, _delegate(component, name, method))
+
 
+_bind_methods(Indicator, {'trend': TrendIndicator, 'momentum': MomentumIndicator, 'volatility': VolatilityIndicator, 'volume': VolumeIndicator})
+_bind_methods(Plotter, _PLOTTER_COMPONENTS)
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+from vnstock_ta.interface import Indicator
+
+SPECS = ['rsi', 'adx', 'macd', ('sma', {'length': 20}), ('bbands', {'length': 20})]
+
+
+def _prices(n: int = 1500, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    spread = np.abs(rng.normal(0, 0.005, n)) * close
+    return pd.DataFrame({
+        'open': close + rng.normal(0, 0.002, n) * close,
+        'high': close + spread,
+        'low': close - spread,
+        'close': close,
+        'volume': rng.integers(1_000, 100_000, n).astype(float),
+    }, index=pd.date_range('2015-01-01', periods=n, freq='D'))
+
+
+def _full_history(data: pd.DataFrame) -> pd.DataFrame:
+    indicator = Indicator(data)
+    return pd.concat([getattr(indicator, name)(**params) for name, params in
+                      ((spec, {}) if isinstance(spec, str) else spec for spec in SPECS)], axis=1)
+
+
+@pytest.mark.parametrize('offset', [-1, 0, 1])
+@pytest.mark.parametrize('scale', [0.5, 1, 2])
+def test_chunks_match_full_history(scale, offset):
+    data = _prices()
+    lookback = Indicator(data)._chunk_lookback([(spec, {}) if isinstance(spec, str) else spec for spec in SPECS])
+    size = max(int(lookback * scale) + offset, 1)
+    chunks = (data.iloc[start:start + size] for start in range(0, len(data), size))
+
+    chunked = pd.concat(list(Indicator.compute_chunks(chunks, SPECS)))
+
+    pd.testing.assert_frame_equal(chunked, _full_history(data), check_exact=False, atol=1e-3, rtol=0)
+
+
+def test_short_and_empty_chunks():
+    data = _prices(300)
+    chunks = [data.iloc[:5], data.iloc[:0], data.iloc[5:40], data.iloc[40:]]
+
+    results = list(Indicator.compute_chunks(chunks, SPECS))
+
+    assert sum(len(result) for result in results) == len(data)
+    pd.testing.assert_frame_equal(pd.concat(results), _full_history(data), check_exact=False, atol=1e-3, rtol=0)
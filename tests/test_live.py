@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+from vnstock_ta.chart.live import LiveChart
+
+OVERLAYS = ['sma', ('bbands', {'length': 20})]
+SUBPLOTS = ['rsi', 'macd']
+
+
+def _prices(n: int = 300, seed: int = 3) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    spread = np.abs(rng.normal(0, 0.005, n)) * close
+    return pd.DataFrame({
+        'open': close + rng.normal(0, 0.002, n) * close,
+        'high': close + spread,
+        'low': close - spread,
+        'close': close,
+        'volume': rng.integers(1_000, 100_000, n).astype(float),
+    }, index=pd.date_range('2020-01-01', periods=n, freq='D'))
+
+
+def _assert_points_equal(actual, expected):
+    assert len(actual) == len(expected)
+    for got, want in zip(actual, expected):
+        assert type(got) is type(want)
+        if isinstance(want, dict):
+            assert got['itemStyle'] == want['itemStyle']
+            np.testing.assert_allclose(got['value'], want['value'])
+        elif isinstance(want[0], str):
+            assert got[0] == want[0]
+            if want[1] is None:
+                assert got[1] is None
+            else:
+                # Tail-mode recursive indicators may differ from the full history in the last rounded digit.
+                np.testing.assert_allclose(got[1], want[1], atol=0.011)
+        else:
+            np.testing.assert_allclose(got, want)
+
+
+def test_payload_matches_rebuild():
+    data = _prices()
+    live = LiveChart(data.iloc[:250], overlays=OVERLAYS, subplots=SUBPLOTS)
+    live.build()
+    # Revise the last two bars and append three new ones.
+    revised = data.iloc[248:253].copy()
+    revised.iloc[0, revised.columns.get_loc('close')] *= 1.01
+
+    update = live.payload(revised)
+
+    merged = pd.concat([data.iloc[:248], revised])
+    rebuilt = LiveChart(merged, overlays=OVERLAYS, subplots=SUBPLOTS).build().options
+    assert update['drop'] == 2
+    assert update['time'] == rebuilt['xAxis'][0]['data'][-len(update['time']):]
+    assert len(update['series']) == len(rebuilt['series'])
+    for points, series in zip(update['series'], rebuilt['series']):
+        _assert_points_equal(points, series['data'][-len(points):])
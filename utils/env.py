@@ -93,6 +93,49 @@ class SystemInfo:
             return f"Error determining OS: {str(e)}"
 
 
+_ENVIRONMENT = None
+
+
+def detect_environment() -> dict:
+    """
+    Detect the interface, hosting service and operating system once per process.
+
+    Returns:
+        dict: 'interface', 'hosting' and 'os' as reported by SystemInfo, or as declared with set_environment.
+    """
+    global _ENVIRONMENT
+    if _ENVIRONMENT is None:
+        system_info = SystemInfo()
+        _ENVIRONMENT = {
+            'interface': system_info.interface(),
+            'hosting': system_info.hosting(),
+            'os': system_info.os(),
+        }
+    return dict(_ENVIRONMENT)
+
+
+def set_environment(interface: str = "Other", hosting: str = "Local or Unknown", os_name: str = None):
+    """
+    Declare the render environment instead of probing it, e.g. on a headless server.
+
+    Args:
+        interface (str): 'Jupyter', 'Terminal' or 'Other'. Default is 'Other' (render to a temporary HTML file,
+            or in memory with display='html').
+            None clears the declared or detected environment, so the next detect_environment() probes it again.
+        hosting (str): Hosting service as named by SystemInfo.hosting(). Default is 'Local or Unknown'.
+        os_name (str): Operating system. Default is None (detected, which does not probe the interface).
+    """
+    global _ENVIRONMENT
+    if interface is None:
+        _ENVIRONMENT = None
+        return
+    _ENVIRONMENT = {
+        'interface': interface,
+        'hosting': hosting,
+        'os': os_name if os_name is not None else SystemInfo().os(),
+    }
+
+
 lc_init()
 
 def idv():